@@ -49,12 +49,15 @@ try:
         crawl_and_summarize,
         extract_and_summarize,
         social_media_search,
+        asocial_media_search,
+        slim_search_result,
     )
 
     from .agents import hybrid_research
 
     from .utilities import (
         ainvoke_with_fallback,
+        astream_with_fallback,
         clean_raw_content,
         clean_formatted_output,
         count_tokens,
@@ -63,6 +66,11 @@ try:
         synthesize_results,
         format_web_results,
         handle_research_stream,
+        json_dumps,
+        json_loads,
+        SemanticCache,
+        HistoryTrimmer,
+        trim_history,
     )
 except ImportError:
     # Direct import (e.g., pytest running from agent-toolkit directory)
@@ -94,10 +102,13 @@ __all__ = [
     "crawl_and_summarize",
     "extract_and_summarize",
     "social_media_search",
+    "asocial_media_search",
+    "slim_search_result",
     # Agents
     "hybrid_research",
     # Utilities
     "ainvoke_with_fallback",
+    "astream_with_fallback",
     "clean_raw_content",
     "clean_formatted_output",
     "count_tokens",
@@ -106,4 +117,9 @@ __all__ = [
     "synthesize_results",
     "format_web_results",
     "handle_research_stream",
+    "json_dumps",
+    "json_loads",
+    "SemanticCache",
+    "HistoryTrimmer",
+    "trim_history",
 ]
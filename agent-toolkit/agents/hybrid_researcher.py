@@ -1,17 +1,205 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import random
+import tempfile
 import time
-from typing import Any, Callable, Literal, Optional, Type, cast
+import zlib
+from pathlib import Path
+from typing import (Any, AsyncIterator, Callable, Literal, Optional, Type,
+                    cast)
 
 import httpx
 from pydantic import BaseModel
-from tavily import TavilyClient
 
-from ..utilities.utils import (ainvoke_with_fallback, clean_formatted_output,
+from ..utilities.fast_json import json_dumps, json_loads
+from ..utilities.ratelimit import TokenBucket
+from ..utilities.research_stream import _collect_research_stream
+from ..utilities.utils import (_dedup_subqueries, _get_async_tavily_client,
+                               _get_tavily_client, _schema_str, _tavily_schema,
+                               ainvoke_with_fallback, clean_formatted_output,
                                format_web_results, generate_subqueries,
                                synthesize_results)
 from ..models import (HybridResearchResponse, LLMUsage, ModelConfig,
                       OutputSchema, ToolUsageStats)
 from ..tools.async_search_and_dedup import search_dedup
 
+_RESEARCH_URL = "https://api.tavily.com/research/"
+# Shared by every research poll in the process so concurrent jobs cannot flood the API
+_POLL_LIMITER = TokenBucket(rate=float(os.environ.get("TAVILY_POLL_RPS", "20")))
+_REFINE_BRIEF_PROMPT = """Context (internal research): {internal_results}
+Identify what information is missing or incomplete above. Output a concise research prompt for a web search to fill those gaps. The prompt should not include details from the internal research just a new research prompt.
+Do not reference or include any of the internal research content—just output the research prompt."""
+_RESEARCH_CACHE_DIR = Path(os.environ.get("TAVILY_RESEARCH_CACHE_DIR", "~/.cache/tavily_research")).expanduser()
+
+
+# Research jobs currently running, keyed on (api_key, research key)
+_inflight_research: dict[tuple[str, str], "asyncio.Task[tuple[str, list[dict[str, Any]]]]"] = {}
+
+
+def _research_key(brief: str, schema_dict: Optional[dict[str, Any]]) -> str:
+    payload = json.dumps({"brief": brief, "schema": schema_dict}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _read_research_cache(path: Path, ttl: float) -> Optional[tuple[str, list[dict[str, Any]]]]:
+    """Return a cached (report, sources) pair if present and younger than ``ttl`` seconds."""
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        cached = json_loads(gzip.decompress(path.read_bytes()))
+        return cached["content"], cached["sources"]
+    except (OSError, EOFError, zlib.error, ValueError, KeyError):
+        return None
+
+
+def _write_research_cache(path: Path, report: str, sources: list[dict[str, Any]]) -> None:
+    """Write a research result atomically so concurrent readers never see a partial file.
+
+    Entries are gzipped; reports and raw source content shrink several times over.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(gzip.compress(json_dumps({"content": report, "sources": sources}).encode(), compresslevel=6))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+async def _poll_research(
+    api_key: str,
+    request_id: str,
+    poll_initial: float = 0.05,
+    poll_backoff_base: float = 1.3,
+    poll_cap: float = 30.0,
+    max_wait: Optional[float] = None,
+) -> dict[str, Any]:
+    """Poll a Tavily research job until it completes.
+
+    The delay between polls grows exponentially from ``poll_initial`` up to
+    ``poll_cap`` (with +/-20% jitter) so short jobs are picked up quickly without
+    hammering the API while long jobs run. Requests across all concurrent polls
+    are capped at ``TAVILY_POLL_RPS`` per second (default 20).
+    """
+    headers = {"Authorization": f"Bearer {api_key}"}
+    deadline = time.monotonic() + max_wait if max_wait is not None else None
+    attempt = 0
+
+    # Scoped to this job: an AsyncClient is bound to the event loop it first runs on
+    async with httpx.AsyncClient(headers=headers, timeout=60) as client:
+        while True:
+            async with _POLL_LIMITER:
+                response = await client.get(_RESEARCH_URL + request_id)
+            response_json = json_loads(response.content)
+
+            status = response_json["status"]
+            if status == "completed":
+                return response_json
+
+            if status == "failed":
+                raise RuntimeError("Research failed to complete")
+
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"Research {request_id} did not complete within {max_wait}s")
+
+            # Jitter keeps jobs started together from polling in lockstep
+            delay = min(poll_cap, poll_initial * (poll_backoff_base ** attempt))
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            attempt += 1
+
+
+async def _run_internal_rag(internal_rag_function: Callable[[str], str], query: str) -> tuple[str, float]:
+    """Run the (synchronous) internal RAG function off the event loop and time it."""
+    internal_start = time.perf_counter()
+    internal_results = await asyncio.to_thread(internal_rag_function, query)
+    return internal_results, time.perf_counter() - internal_start
+
+
+async def _run_web_research(
+    api_key: str,
+    brief: str,
+    schema_dict: Optional[dict[str, Any]] = None,
+    cache_ttl: Optional[float] = None,
+) -> tuple[str, list[dict[str, Any]], float]:
+    """Run a Tavily research job and return its report, sources and elapsed time.
+
+    Credits are not reported for the research endpoint, so only time is tracked.
+    With ``cache_ttl`` set, results are cached on disk keyed on the brief and schema.
+    Concurrent calls for the same brief and schema share a single upstream job.
+    """
+    research_start = time.perf_counter()
+    key = _research_key(brief, schema_dict)
+    cache_path = _RESEARCH_CACHE_DIR / f"{key}.json.gz" if cache_ttl is not None else None
+    if cache_path is not None:
+        cached = _read_research_cache(cache_path, cast(float, cache_ttl))
+        if cached is not None:
+            return cached[0], cached[1], time.perf_counter() - research_start
+
+    inflight_key = (api_key, key)
+    task = _inflight_research.get(inflight_key)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(_research_job(api_key, brief, schema_dict))
+        _inflight_research[inflight_key] = task
+
+        def _forget(done: asyncio.Future) -> None:
+            if _inflight_research.get(inflight_key) is done:
+                del _inflight_research[inflight_key]
+
+        task.add_done_callback(_forget)
+
+    # Shielded so one caller being cancelled does not cancel the job for the others
+    research_report, sources = await asyncio.shield(task)
+
+    if cache_path is not None:
+        _write_research_cache(cache_path, research_report, sources)
+    return research_report, sources, time.perf_counter() - research_start
+
+
+async def _research_job(
+    api_key: str,
+    brief: str,
+    schema_dict: Optional[dict[str, Any]],
+) -> tuple[str, list[dict[str, Any]]]:
+    try:
+        # Stream the job so the report arrives as soon as it is written, with no polling.
+        # The request is only sent on first iteration, so pull the first chunk here.
+        stream = cast(AsyncIterator[bytes], await _get_async_tavily_client(api_key).research(
+            brief, stream=True, output_schema=cast(dict[str, Any], schema_dict)
+        ))
+        first_chunk = await stream.__anext__()
+    except Exception:
+        # The stream could not be opened: fall back to a queued job polled with backoff.
+        # Failures after this point propagate so a running job is never paid for twice.
+        response = cast(dict[str, Any], await asyncio.to_thread(
+            _get_tavily_client(api_key).research, brief, stream=False, output_schema=cast(dict[str, Any], schema_dict)
+        ))
+        research_json = await _poll_research(api_key, response["request_id"])
+        return research_json["content"], research_json["sources"]
+
+    return await _collect_research_stream(_prepend_chunk(first_chunk, stream))
+
+
+async def _prepend_chunk(first_chunk: bytes, rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    yield first_chunk
+    async for chunk in rest:
+        yield chunk
+
+
+def _as_text(value: Any) -> str:
+    """Return ``value`` unchanged if it is already a string, avoiding a redundant str() round trip."""
+    return value if isinstance(value, str) else str(value)
+
+
+def _post_process_web_results(search_results: list[dict[str, Any]]) -> tuple[str, list[dict[str, str]]]:
+    """Format and clean search results for synthesis and collect their sources."""
+    cleaned_formatted_output = clean_formatted_output(format_web_results(search_results))
+    sources = [{"title": result["title"], "url": result["url"]} for result in search_results]
+    return cleaned_formatted_output, sources
+
 
 async def hybrid_research(
     api_key: str,
@@ -21,16 +209,21 @@ async def hybrid_research(
     mode: Literal["fast", "multi_agent"] = "fast",
     output_schema: Optional[Type[OutputSchema]] = None,
     research_synthesis_prompt: Optional[str] = None,
+    research_cache_ttl: Optional[float] = None,
 ) -> dict[str, Any]:
     """Hybrid research combining internal RAG with web search.
     
+    Args:
+        research_cache_ttl: Multi-agent mode only. Seconds to reuse an on-disk copy of an
+            identical Tavily research job; None (default) disables the cache.
+    
     Returns:
         Dictionary containing report, web_sources, and usage metrics
     """
     if mode == "fast":
         return await fast_mode(api_key, query, model_config, internal_rag_function, output_schema, research_synthesis_prompt)
     elif mode == "multi_agent":
-        return await multi_agent_mode(api_key, query, model_config, internal_rag_function, output_schema, research_synthesis_prompt)
+        return await multi_agent_mode(api_key, query, model_config, internal_rag_function, output_schema, research_synthesis_prompt, research_cache_ttl)
     else:
         raise ValueError(f"Invalid mode: {mode}")
 
@@ -47,9 +240,7 @@ async def fast_mode(
     usage = ToolUsageStats()
     
     # Run internal RAG function with timing
-    internal_start = time.perf_counter()
-    internal_results = internal_rag_function(query)
-    usage.internal_function_response_time = time.perf_counter() - internal_start
+    internal_results, usage.internal_function_response_time = await _run_internal_rag(internal_rag_function, query)
     
     # Generate subqueries with LLM usage tracking
     subquery_result = await generate_subqueries(
@@ -62,8 +253,12 @@ async def fast_mode(
     subqueries, subquery_usage = cast(tuple[list[str], LLMUsage], subquery_result)
     usage.llm.merge(subquery_usage)
     
+    # Skip paraphrased subqueries before they cost a search each
+    unique_subqueries = _dedup_subqueries(subqueries)
+    usage.tavily.deduped_query_count += len(subqueries) - len(unique_subqueries)
+    
     # Web search with Tavily usage tracking
-    web_results = await search_dedup(api_key, subqueries)
+    web_results = await search_dedup(api_key, unique_subqueries)
     
     # Extract tavily usage from search_dedup result
     if "tavily_usage" in web_results:
@@ -74,9 +269,9 @@ async def fast_mode(
     if "response_time" in web_results:
         web_results.pop("response_time")
     
-    formatted_web_results = format_web_results(web_results["results"])
-    cleaned_formatted_output = clean_formatted_output(formatted_web_results)
-    research_results = f"{internal_results}\n\n{cleaned_formatted_output}"
+    # Formatting and cleaning are CPU-bound, so keep them off the event loop
+    cleaned_formatted_output, sources = await asyncio.to_thread(_post_process_web_results, web_results["results"])
+    research_results = "\n\n".join((_as_text(internal_results), cleaned_formatted_output))
     
     # Synthesize results with LLM usage tracking
     synthesis_result = await synthesize_results(
@@ -87,11 +282,6 @@ async def fast_mode(
     report, synthesis_usage = cast(tuple[str | BaseModel, LLMUsage], synthesis_result)
     usage.llm.merge(synthesis_usage)
     
-    sources = []
-    search_results = web_results["results"]
-    for result in search_results:
-        sources.append({"title": result["title"], "url": result["url"]})
-    
     if isinstance(report, BaseModel):
         report = report.model_dump_json()
     
@@ -111,64 +301,36 @@ async def multi_agent_mode(
     internal_rag_function: Callable[[str], str],
     output_schema: Optional[Type[OutputSchema]] = None,
     research_synthesis_prompt: Optional[str] = None,
+    research_cache_ttl: Optional[float] = None,
 ) -> dict[str, Any]:
     start_time = time.perf_counter()
     usage = ToolUsageStats()
     
-    # Internal Research Agent with timing
-    internal_start = time.perf_counter()
-    internal_results = internal_rag_function(query)
-    usage.internal_function_response_time = time.perf_counter() - internal_start
-
-    # Generate Brief for web agent to fill in gaps
-    refine_brief_prompt = f"""Context (internal research): {internal_results}
-        Identify what information is missing or incomplete above. Output a concise research prompt for a web search to fill those gaps. The prompt should not include details from the internal research just a new research prompt.
-        Do not reference or include any of the internal research content—just output the research prompt."""
-
-    brief_response = await ainvoke_with_fallback(model_config, refine_brief_prompt, return_usage=True)
-    usage.llm.merge(brief_response.usage)
-    refined_brief = cast(str, brief_response.result.content)
-    
-    if output_schema:
-        refined_brief = f"Fill out this schema: {output_schema.model_json_schema()}"
-   
-    # Web Agent - Tavily Research endpoint (track time but not credits per user request)
-    tavily_client = TavilyClient(api_key=api_key)
-    schema_dict = None
     if output_schema:
-        schema_dict = output_schema.to_tavily_schema()
-    
-    research_start = time.perf_counter()
-    response = cast(dict[str, Any], tavily_client.research(refined_brief, stream=False, output_schema=cast(dict[str, Any], schema_dict)))
-    request_id = response["request_id"]
-
-    url = "https://api.tavily.com/research/"
-    headers = {"Authorization": f"Bearer {api_key}"}
-    research_report = ""
-    sources = []
-
-    # Poll every 10 seconds
-    while True:
-        response = httpx.get(url + request_id, headers=headers)
-        response_json = response.json()
+        # The brief is replaced by the schema, so web research does not depend on
+        # the internal results and both agents can run at the same time
+        refined_brief = f"Fill out this schema: {_schema_str(output_schema)}"
+        schema_dict = _tavily_schema(output_schema)
+        (internal_results, internal_time), (research_report, sources, research_time) = await asyncio.gather(
+            _run_internal_rag(internal_rag_function, query),
+            _run_web_research(api_key, refined_brief, schema_dict, research_cache_ttl),
+        )
+        usage.internal_function_response_time = internal_time
+    else:
+        # Internal Research Agent with timing
+        internal_results, usage.internal_function_response_time = await _run_internal_rag(internal_rag_function, query)
 
-        status = response_json["status"]
-        if status == "completed":
-            research_report = response_json["content"]
-            sources = response_json["sources"]
-            break
+        # Generate Brief for web agent to fill in gaps
+        refine_brief_prompt = _REFINE_BRIEF_PROMPT.format(internal_results=internal_results)
 
-        if status == "failed":
-            raise RuntimeError("Research failed to complete")
+        brief_response = await ainvoke_with_fallback(model_config, refine_brief_prompt, return_usage=True)
+        usage.llm.merge(brief_response.usage)
+        refined_brief = cast(str, brief_response.result.content)
 
-        time.sleep(10)
-    
-    # Track research endpoint time (credits not available for research endpoint)
-    research_time = time.perf_counter() - research_start
-    # Store in a custom field since research is different from search/extract/crawl
-    # We'll add it to the tavily dict manually in to_dict output
+        # Web Agent - Tavily Research endpoint (track time but not credits per user request)
+        research_report, sources, research_time = await _run_web_research(api_key, refined_brief, cache_ttl=research_cache_ttl)
 
-    research_results = f"{str(internal_results)}\n\n{research_report}"
+    research_results = "\n\n".join((_as_text(internal_results), _as_text(research_report)))
     
     # Synthesis into a report with sources
     synthesis_result = await synthesize_results(
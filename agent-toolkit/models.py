@@ -69,6 +69,7 @@ class _SearchDedupResponseOptional(TypedDict, total=False):
     """Optional fields for SearchDedupResponse."""
     tavily_usage: dict[str, Any]
     response_time: float
+    error: str
 
 
 class SearchDedupResponse(_SearchDedupResponseOptional):
@@ -113,6 +114,7 @@ class TavilyUsage:
     search_response_time: float = 0.0
     extract_response_time: float = 0.0
     crawl_response_time: float = 0.0
+    deduped_query_count: int = 0
     
     def add_search(self, credits: int, response_time: float) -> None:
         """Record a search API call."""
@@ -141,6 +143,7 @@ class TavilyUsage:
         self.search_response_time += other.search_response_time
         self.extract_response_time += other.extract_response_time
         self.crawl_response_time += other.crawl_response_time
+        self.deduped_query_count += other.deduped_query_count
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization. Only includes used API types."""
@@ -158,6 +161,9 @@ class TavilyUsage:
             result["crawl_count"] = self.crawl_count
             result["crawl_response_time"] = round(self.crawl_response_time, 3)
         
+        if self.deduped_query_count > 0:
+            result["deduped_query_count"] = self.deduped_query_count
+        
         return result
 
 
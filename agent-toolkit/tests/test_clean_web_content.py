@@ -1,21 +1,8 @@
 """Test clean_raw_content with real web data from Tavily extract."""
 
-import re
-from pathlib import Path
-
 from tavily import TavilyClient
 
-# Read and execute clean_raw_content from local filesystem
-_utils_path = Path(__file__).parent.parent / "utilities" / "utils.py"
-_source = _utils_path.read_text()
-
-# Extract just the clean_raw_content function
-_start = _source.find("def clean_raw_content(")
-_end = _source.find("\ndef ", _start + 1)
-_func_source = _source[_start:_end]
-
-# Execute to define the function
-exec(compile(_func_source, "<clean_raw_content>", "exec"), globals())
+from tavily_agent_toolkit import clean_raw_content
 
 
 def test_clean_web_content():
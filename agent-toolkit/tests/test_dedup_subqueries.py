@@ -0,0 +1,38 @@
+"""Tests for subquery deduplication - runs offline, no model or API calls."""
+
+from tavily_agent_toolkit.utilities.utils import _dedup_subqueries
+
+WORDS = [f"w{i}" for i in range(20)]
+
+
+class TestDedupSubqueries:
+    """Test _dedup_subqueries functionality."""
+
+    def test_case_and_whitespace_duplicates_dropped(self):
+        """Queries differing only in case or spacing count as repeats."""
+        queries = ["Nvidia Q3 earnings", "nvidia q3 EARNINGS", "  Nvidia   Q3\tearnings "]
+
+        assert _dedup_subqueries(queries) == ["Nvidia Q3 earnings"]
+
+    def test_kept_queries_have_whitespace_collapsed(self):
+        """A kept query is rewritten with single spaces."""
+        assert _dedup_subqueries(["  Nvidia   Q3\tearnings "]) == ["Nvidia Q3 earnings"]
+
+    def test_similarity_threshold_is_exclusive(self):
+        """Jaccard similarity of exactly 0.85 is kept; anything above is dropped."""
+        base = " ".join(WORDS[:17])
+        at_threshold = " ".join(WORDS[:20])  # 17 shared of 20 words = 0.85
+        above_threshold = " ".join(WORDS[:17] + WORDS[19:20])  # 17 shared of 18 words
+
+        assert _dedup_subqueries([base, at_threshold]) == [base, at_threshold]
+        assert _dedup_subqueries([base, above_threshold]) == [base]
+
+    def test_order_preserved_and_first_occurrence_kept(self):
+        """Distinct queries keep their order and a duplicate never displaces the original."""
+        queries = ["rust release date", "python price", "Rust release date", "nvidia news"]
+
+        assert _dedup_subqueries(queries) == ["rust release date", "python price", "nvidia news"]
+
+    def test_queries_without_words_dropped(self):
+        """Empty or punctuation-only queries are skipped."""
+        assert _dedup_subqueries(["", "  ", "?!", "python"]) == ["python"]
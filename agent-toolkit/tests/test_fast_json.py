@@ -0,0 +1,24 @@
+"""Tests for the orjson-backed JSON helpers - runs offline."""
+
+import importlib
+import sys
+
+from tavily_agent_toolkit.utilities import fast_json
+
+
+class TestFastJson:
+    """Test json_dumps/json_loads with and without orjson."""
+
+    def test_stdlib_fallback_matches_orjson(self, monkeypatch):
+        """Both implementations produce the same text, so cached output is stable."""
+        payload = {"title": "Zürich", "results": [{"url": "https://x.com", "score": 0.5}]}
+        fast = (fast_json.json_dumps(payload), fast_json.json_dumps(payload, indent=True))
+
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        try:
+            fallback = importlib.reload(fast_json)
+            assert (fallback.json_dumps(payload), fallback.json_dumps(payload, indent=True)) == fast
+            assert fallback.json_loads(fast[0]) == payload
+        finally:
+            monkeypatch.undo()
+            importlib.reload(fast_json)
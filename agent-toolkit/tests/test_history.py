@@ -0,0 +1,47 @@
+"""Tests for HistoryTrimmer - runs offline with fake tool-result blocks."""
+
+from tavily_agent_toolkit import HistoryTrimmer, json_dumps, json_loads
+
+
+def _tool_turn(raw_chars: int) -> list[dict]:
+    content = json_dumps({"results": [{"url": "https://reddit.com/r/x/1", "raw_content": "x" * raw_chars}]})
+    return [{"type": "tool_result", "tool_use_id": "toolu_1", "content": content}]
+
+
+def _has_raw_content(tool_results: list[dict]) -> bool:
+    return "raw_content" in json_loads(tool_results[0]["content"])["results"][0]
+
+
+class TestHistoryTrimmer:
+    """Test HistoryTrimmer functionality."""
+
+    def test_newest_turn_keeps_raw_content(self):
+        """Only turns the model has already read are trimmed."""
+        trimmer = HistoryTrimmer(max_chars=1000)
+        messages = [{"role": "user", "content": "query"}]
+        turns = []
+        trimmed = []
+        for _ in range(2):
+            turns.append(_tool_turn(2000))
+            messages.append({"role": "assistant", "content": "calling tool"})
+            messages.append({"role": "user", "content": turns[-1]})
+            trimmed.append(trimmer.add_turn(messages, turns[-1]))
+
+        assert trimmed == [False, True]
+        assert not _has_raw_content(turns[0])
+        assert _has_raw_content(turns[1])
+        assert messages[0]["content"] == "query"
+
+    def test_next_trim_waits_for_another_max_chars(self):
+        """After a trim, small turns do not trigger another one until max_chars builds up again."""
+        trimmer = HistoryTrimmer(max_chars=1000)
+        messages = [{"role": "user", "content": "query"}]
+        trimmed = []
+        for raw_chars in (2000, 300, 300, 300, 300):
+            turn = _tool_turn(raw_chars)
+            messages.append({"role": "user", "content": turn})
+            trimmed.append(trimmer.add_turn(messages, turn))
+
+        # A turn counts once the next one arrives. Each 300-char turn is 365 chars of
+        # JSON, so after the first trim it takes three of them to pass 1000 again.
+        assert trimmed == [False, True, False, False, True]
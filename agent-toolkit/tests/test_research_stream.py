@@ -0,0 +1,37 @@
+"""Tests for research stream collection - runs offline with canned SSE bytes."""
+
+import json
+
+import pytest
+from tavily_agent_toolkit.utilities.research_stream import _collect_research_stream
+
+
+def _sse(content: str, done: bool = True) -> bytes:
+    data = json.dumps({"choices": [{"delta": {"content": content}}]}, ensure_ascii=False)
+    body = f"event: chat.completion.chunk\ndata: {data}\n\n"
+    if done:
+        body += "event: done\ndata: {}\n\n"
+    return body.encode("utf-8")
+
+
+async def _chunks(payload: bytes, size: int):
+    for i in range(0, len(payload), size):
+        yield payload[i:i + size]
+
+
+class TestCollectResearchStream:
+    """Test _collect_research_stream functionality."""
+
+    @pytest.mark.asyncio
+    async def test_multibyte_characters_split_across_chunks(self):
+        """Characters cut between byte chunks are decoded intact."""
+        report, sources = await _collect_research_stream(_chunks(_sse("Zürich → 東京"), size=1))
+
+        assert report == "Zürich → 東京"
+        assert sources == []
+
+    @pytest.mark.asyncio
+    async def test_stream_without_done_event_raises(self):
+        """A stream that stops early is an error, not a finished report."""
+        with pytest.raises(RuntimeError):
+            await _collect_research_stream(_chunks(_sse("partial", done=False), size=16))
@@ -0,0 +1,103 @@
+"""Tests for SemanticCache - runs offline with deterministic embeddings."""
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from tavily_agent_toolkit import SemanticCache
+
+
+class KeywordEmbeddings(Embeddings):
+    """Bag-of-keywords embeddings so similarity is predictable."""
+
+    VOCAB = ["python", "rust", "release", "date", "price", "nvidia"]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        words = text.lower().split()
+        return [float(words.count(term)) for term in self.VOCAB]
+
+
+class CountingEmbeddings(KeywordEmbeddings):
+    """KeywordEmbeddings that records every text it embeds."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls.append(text)
+        return super().embed_query(text)
+
+
+class TestSemanticCache:
+    """Test SemanticCache functionality."""
+
+    @pytest.mark.asyncio
+    async def test_similar_query_hits(self):
+        """A reworded query with the same meaning reuses the cached response."""
+        cache = SemanticCache(KeywordEmbeddings(), threshold=0.9)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return "python release notes"
+
+        first = await cache.aget_or_compute("python release date", compute)
+        second = await cache.aget_or_compute("Python RELEASE date ?", compute)
+
+        assert first == second == "python release notes"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_dissimilar_query_and_scope_miss(self):
+        """Different queries, or the same query in another scope, are computed."""
+        cache = SemanticCache(KeywordEmbeddings(), threshold=0.9)
+        await cache.aset("python release date", "python", scope="week")
+
+        assert await cache.aget("nvidia price", scope="week") is None
+        assert await cache.aget("python release date", scope="day") is None
+        assert await cache.aget("python release date", scope="week") == "python"
+
+    @pytest.mark.asyncio
+    async def test_ttl_and_eviction(self):
+        """Expired entries are dropped and the least recently used entry is evicted."""
+        expired = SemanticCache(KeywordEmbeddings(), ttl=0)
+        await expired.aset("python release", "stale")
+        assert await expired.aget("python release") is None
+        assert len(expired) == 0
+
+        cache = SemanticCache(KeywordEmbeddings(), max_entries=2)
+        await cache.aset("python", "a")
+        await cache.aset("rust", "b")
+        await cache.aget("python")
+        await cache.aset("nvidia", "c")
+
+        assert len(cache) == 2
+        assert await cache.aget("rust") is None
+        assert await cache.aget("python") == "a"
+
+    @pytest.mark.asyncio
+    async def test_identical_query_skips_embedding(self):
+        """Repeating a query verbatim is served without calling the embeddings model."""
+        embeddings = CountingEmbeddings()
+        cache = SemanticCache(embeddings)
+        await cache.aset("python release date", "python", scope="week")
+
+        assert await cache.aget("python release date", scope="week") == "python"
+        assert embeddings.calls == ["python release date"]
+
+    @pytest.mark.asyncio
+    async def test_cache_if_skips_rejected_values(self):
+        """Values rejected by cache_if are returned but computed again next time."""
+        cache = SemanticCache(KeywordEmbeddings())
+        values = iter(["partial", "complete", "unused"])
+
+        async def compute():
+            return next(values)
+
+        def is_complete(value):
+            return value != "partial"
+
+        assert await cache.aget_or_compute("python", compute, cache_if=is_complete) == "partial"
+        assert await cache.aget_or_compute("python", compute, cache_if=is_complete) == "complete"
+        assert await cache.aget_or_compute("python", compute, cache_if=is_complete) == "complete"
@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 from dotenv import load_dotenv
 
-from tavily_agent_toolkit import social_media_search
+from tavily_agent_toolkit import asocial_media_search, social_media_search
 from tavily_agent_toolkit.tools.social_media import PLATFORM_DOMAINS
 
 # Load .env from project root
@@ -347,6 +347,24 @@ class TestSocialMediaSearchWithRawContent:
         
         print("\nUsage metrics (search + extract):", usage)
 
+    @pytest.mark.asyncio
+    async def test_async_reddit_with_raw_content(self, api_key):
+        """Test the async variant returns the same shape as the sync search."""
+        result = await asocial_media_search(
+            query="python programming",
+            api_key=api_key,
+            platform="reddit",
+            include_raw_content=True,
+            max_results=3,
+        )
+        
+        assert "results" in result
+        assert isinstance(result["results"], list)
+        for r in result["results"]:
+            assert "reddit.com" in r["url"]
+            assert "raw_content" in r
+        assert result["usage"]["tavily"]["search_count"] == 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,92 @@
+"""Tests for asocial_media_search failure handling - runs offline with a fake Tavily client."""
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from tavily_agent_toolkit import SemanticCache, asocial_media_search, slim_search_result
+from tavily_agent_toolkit.tools import social_media
+
+
+class ConstantEmbeddings(Embeddings):
+    """Embeds every text to the same vector, so any stored entry would be a hit."""
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return [1.0]
+
+
+class FakeAsyncClient:
+    """Stands in for AsyncTavilyClient; raises instead of calling the API when told to."""
+
+    def __init__(self, search_error: Exception = None, extract_error: Exception = None):
+        self.search_error = search_error
+        self.extract_error = extract_error
+
+    async def search(self, **kwargs):
+        if self.search_error:
+            raise self.search_error
+        return {"results": [{"title": "Thread", "url": "https://reddit.com/r/x/1", "content": "snippet"}]}
+
+    async def extract(self, **kwargs):
+        if self.extract_error:
+            raise self.extract_error
+        return {"results": [{"url": url, "raw_content": "full thread"} for url in kwargs["urls"]]}
+
+
+def _not_failed(result: dict) -> bool:
+    # The cache_if predicate the social media use-cases pass to SemanticCache
+    return "error" not in result and "extraction_error" not in result
+
+
+async def _search(monkeypatch, client: FakeAsyncClient) -> dict:
+    monkeypatch.setattr(social_media, "_get_async_tavily_client", lambda api_key: client)
+    return await asocial_media_search(
+        query="python", api_key="tvly-test", platform="reddit",
+        include_raw_content=True, max_retries=0,
+    )
+
+
+class TestSocialMediaFailures:
+    """Test that failed Tavily calls are reported and never cached."""
+
+    @pytest.mark.asyncio
+    async def test_extract_success_merges_raw_content(self, monkeypatch):
+        """A healthy search and extract is cached like any other result."""
+        result = slim_search_result(await _search(monkeypatch, FakeAsyncClient()))
+
+        assert result["results"][0]["raw_content"] == "full thread"
+        assert _not_failed(result)
+
+    @pytest.mark.asyncio
+    async def test_failed_extract_marks_extraction_error(self, monkeypatch):
+        """An extract that the retry wrapper reports as an error is flagged, not silently emptied."""
+        response = await _search(monkeypatch, FakeAsyncClient(extract_error=RuntimeError("extract down")))
+
+        assert response["extraction_error"] == "extract down"
+        assert response["results"][0]["raw_content"] is None
+        assert not _not_failed(slim_search_result(response))
+
+    @pytest.mark.asyncio
+    async def test_failed_search_keeps_error(self, monkeypatch):
+        """A failed search keeps its error through slim_search_result."""
+        response = await _search(monkeypatch, FakeAsyncClient(search_error=RuntimeError("search down")))
+        result = slim_search_result(response)
+
+        assert result == {"answer": None, "results": [], "error": "search down"}
+
+    @pytest.mark.asyncio
+    async def test_failed_results_are_not_cached(self, monkeypatch):
+        """A retry after a failure reaches Tavily again instead of replaying the failure."""
+        cache = SemanticCache(ConstantEmbeddings())
+        client = FakeAsyncClient(extract_error=RuntimeError("extract down"))
+
+        async def search():
+            return slim_search_result(await _search(monkeypatch, client))
+
+        first = await cache.aget_or_compute("python", search, cache_if=_not_failed)
+        client.extract_error = None
+        second = await cache.aget_or_compute("python", search, cache_if=_not_failed)
+
+        assert "extraction_error" in first
+        assert second["results"][0]["raw_content"] == "full thread"
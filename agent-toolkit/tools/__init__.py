@@ -4,7 +4,8 @@ from .crawl_and_summarize import crawl_and_summarize
 from .extract_and_summarize import extract_and_summarize
 from .search_and_answer import search_and_answer
 from .search_and_format import search_and_format
-from .social_media import social_media_search
+from .social_media import (asocial_media_search, slim_search_result,
+                           social_media_search)
 
 __all__ = [
     "search_and_answer",
@@ -13,4 +14,6 @@ __all__ = [
     "crawl_and_summarize",
     "extract_and_summarize",
     "social_media_search",
+    "asocial_media_search",
+    "slim_search_result",
 ]
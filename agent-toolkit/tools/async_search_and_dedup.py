@@ -7,10 +7,8 @@ import asyncio
 import time
 from typing import Any, Optional, Union
 
-from tavily import AsyncTavilyClient
-
 from ..models import SearchDedupResponse, TavilyAPIResponse, TavilyUsage
-from ..utilities.utils import async_retry
+from ..utilities.utils import _get_async_tavily_client, async_retry
 
 
 async def search_dedup(
@@ -83,7 +81,7 @@ async def search_dedup(
     """
     start_time = time.perf_counter()
     
-    client = AsyncTavilyClient(api_key=api_key)
+    client = _get_async_tavily_client(api_key)
     
     # Build search kwargs
     search_kwargs = {
@@ -133,6 +131,9 @@ async def search_dedup(
     result = _deduplicate_by_url(search_responses)
     result["tavily_usage"] = tavily_usage.to_dict()
     result["response_time"] = round(total_time, 3)
+    # Failed queries come back as empty results; flag them so a partial result is not taken as complete
+    if errors := [r["error"] for r in search_responses if r.get("error")]:
+        result["error"] = "; ".join(errors)
     
     return result
 
@@ -1,13 +1,13 @@
+import asyncio
 import os
 import time
 from typing import Optional, Type
 
 from pydantic import BaseModel
-from tavily import TavilyClient
 
 from ..models import ModelConfig, ToolUsageStats
-from ..utilities.utils import (ainvoke_with_fallback, clean_raw_content,
-                               crawl_with_retry)
+from ..utilities.utils import (_get_tavily_client, ainvoke_with_fallback,
+                               clean_raw_content, crawl_with_retry)
 
 
 async def crawl_and_summarize(
@@ -39,7 +39,7 @@ async def crawl_and_summarize(
     if not api_key:
         raise ValueError("API key must be provided or set in TAVILY_API_KEY environment variable")
 
-    client = TavilyClient(api_key)
+    client = _get_tavily_client(api_key)
 
     kwargs = {
         "url": url,
@@ -70,7 +70,8 @@ async def crawl_and_summarize(
     if exclude_domains is not None:
         kwargs["exclude_domains"] = exclude_domains
 
-    crawl_response = crawl_with_retry(client, max_retries, **kwargs)
+    # Crawls can take tens of seconds; run the blocking client off the event loop
+    crawl_response = await asyncio.to_thread(crawl_with_retry, client, max_retries, **kwargs)
     usage.tavily.add_crawl(crawl_response.credits, crawl_response.response_time)
 
     results = crawl_response.data.get("results", [])
@@ -117,8 +118,12 @@ Content:
     
     usage.response_time = time.perf_counter() - start_time
     
-    return {
+    response = {
         "results": results,
         "summary": summary,
         "usage": usage.to_dict(),
     }
+    # Surface a failed crawl so callers can tell it apart from an empty site
+    if crawl_response.data.get("error"):
+        response["error"] = crawl_response.data["error"]
+    return response
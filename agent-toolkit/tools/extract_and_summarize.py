@@ -1,13 +1,13 @@
+import asyncio
 import os
 import time
 from typing import Literal, Optional, Type
 
 from pydantic import BaseModel
-from tavily import TavilyClient
 
 from ..models import ModelConfig, ToolUsageStats
-from ..utilities.utils import (ainvoke_with_fallback, clean_raw_content,
-                               extract_with_retry)
+from ..utilities.utils import (_get_tavily_client, ainvoke_with_fallback,
+                               clean_raw_content, extract_with_retry)
 
 
 async def extract_and_summarize(
@@ -50,6 +50,7 @@ async def extract_and_summarize(
         Dictionary containing:
             - results: List of extraction results, each with an added "summary" field
             - observability: Timing and usage metrics
+            - error: Present only when the extract request failed
     
     Example:
         >>> from assets.tools.extract_and_summarize import extract_and_summarize
@@ -76,7 +77,7 @@ async def extract_and_summarize(
     if not api_key:
         raise ValueError("API key must be provided or set in TAVILY_API_KEY environment variable")
 
-    client = TavilyClient(api_key)
+    client = _get_tavily_client(api_key)
 
     # Build extract parameters
     kwargs = {
@@ -95,8 +96,8 @@ async def extract_and_summarize(
     if timeout is not None:
         kwargs["timeout"] = timeout
 
-    # Execute extraction with retry logic
-    extract_response = extract_with_retry(client, max_retries, **kwargs)
+    # Execute extraction with retry logic, off the event loop so other tasks keep running
+    extract_response = await asyncio.to_thread(extract_with_retry, client, max_retries, **kwargs)
     usage.tavily.add_extract(extract_response.credits, extract_response.response_time)
 
     results = extract_response.data.get("results", [])
@@ -148,7 +149,11 @@ Content:
 
     usage.response_time = time.perf_counter() - start_time
     
-    return {
+    response = {
         "results": results,
         "usage": usage.to_dict(),
     }
+    # Surface a failed extract so callers can tell it apart from empty pages
+    if extract_response.data.get("error"):
+        response["error"] = extract_response.data["error"]
+    return response
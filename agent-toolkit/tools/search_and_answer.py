@@ -1,14 +1,16 @@
+import asyncio
 import time
 from typing import (Any, Dict, List, Literal, Optional, Sequence, Type, Union,
                     cast)
 
 from pydantic import BaseModel
-from tavily import TavilyClient
 
 from ..models import ModelConfig, ToolUsageStats
-from ..utilities.utils import (ainvoke_with_fallback, clean_formatted_output,
-                               count_tokens, format_web_results,
-                               search_with_retry, summarize_long_content)
+from ..utilities.utils import (_get_tavily_client, _schema_str,
+                               ainvoke_with_fallback,
+                               clean_formatted_output, count_tokens,
+                               format_web_results, search_with_retry,
+                               summarize_long_content)
 from .async_search_and_dedup import search_dedup
 
 
@@ -46,7 +48,7 @@ async def search_and_answer(
     start_time = time.perf_counter()
     usage = ToolUsageStats()
     
-    tavily_client = TavilyClient(api_key=api_key)
+    tavily_client = _get_tavily_client(api_key)
 
     search_params = {
         "query": query,
@@ -75,7 +77,7 @@ async def search_and_answer(
 Only generate multiple queries if needed to cover the topic comprehensively.
 Do not include dates or years in the queries unless explicitly specified in the original query."""
         if output_schema:
-            schema_str = str(output_schema.model_json_schema())
+            schema_str = _schema_str(output_schema)
             subquery_prompt = f"""Generate up to {max_number_of_subqueries} short Google-style search queries covering different subtopics to fill out this schema: {schema_str}
 
 Query: {query}
@@ -89,7 +91,7 @@ Do not include dates or years in the queries unless explicitly specified in the
         subqueries: list[str] = cast(SubqueriesOutput, subquery_response.result).subqueries
         
         if len(subqueries) == 1:
-            search_response = search_with_retry(tavily_client, max_retries, **search_params)
+            search_response = await asyncio.to_thread(search_with_retry, tavily_client, max_retries, **search_params)
             usage.tavily.add_search(search_response.credits, search_response.response_time)
             result = search_response.data
         else:
@@ -105,7 +107,7 @@ Do not include dates or years in the queries unless explicitly specified in the
             if "response_time" in result:
                 result.pop("response_time")  # Remove since we track overall time
     else:
-        search_response = search_with_retry(tavily_client, max_retries, **search_params)
+        search_response = await asyncio.to_thread(search_with_retry, tavily_client, max_retries, **search_params)
         usage.tavily.add_search(search_response.credits, search_response.response_time)
         result = search_response.data
 
@@ -1,9 +1,8 @@
+import asyncio
 from typing import Any, Dict, List, Literal, Optional, Sequence, Union, cast
 
-from tavily import TavilyClient
-
-from ..utilities.utils import (clean_formatted_output, format_web_results,
-                               search_with_retry)
+from ..utilities.utils import (_get_tavily_client, clean_formatted_output,
+                               format_web_results, search_with_retry)
 from .async_search_and_dedup import search_dedup
 
 
@@ -84,10 +83,10 @@ async def search_and_format(
     result: Dict[str, Any] = {}
     
     if len(queries) == 1:
-        # Single query: use TavilyClient directly
-        tavily_client = TavilyClient(api_key=api_key)
-        search_response = search_with_retry(
-            tavily_client, max_retries, query=queries[0], **search_params
+        # Single query: use the shared TavilyClient directly
+        tavily_client = _get_tavily_client(api_key)
+        search_response = await asyncio.to_thread(
+            search_with_retry, tavily_client, max_retries, query=queries[0], **search_params
         )
         result = search_response.data
         if "results" not in result:
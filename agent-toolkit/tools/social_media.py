@@ -1,10 +1,10 @@
 import time
-from typing import Any, Dict, Literal, Optional
-
-from tavily import TavilyClient
+from typing import Any, Dict, Literal, Optional, Union
 
 from ..models import ToolUsageStats
-from ..utilities.utils import extract_with_retry, search_with_retry
+from ..utilities.utils import (_get_async_tavily_client, _get_tavily_client,
+                               async_retry, extract_with_retry,
+                               search_with_retry)
 
 # Platform domain mapping
 PLATFORM_DOMAINS = {
@@ -32,6 +32,7 @@ def social_media_search(
     include_images: bool = False,
     time_range: Optional[Literal["day", "week", "month", "year"]] = None,
     max_retries: int = 1,
+    search_depth: Literal["basic", "advanced"] = "basic",
 ) -> Dict[str, Any]:
     """
     Search social media platforms using Tavily API.
@@ -55,6 +56,7 @@ def social_media_search(
         include_images: Include images in the response
         time_range: Time range to search (day, week, month, year)
         max_retries: Maximum number of retry attempts per request (default: 3)
+        search_depth: "basic" (default) or "advanced" search depth
     
     Returns:
         Dictionary containing search results with optional raw content and observability
@@ -85,33 +87,10 @@ def social_media_search(
     start_time = time.perf_counter()
     usage = ToolUsageStats()
     
-    # Initialize Tavily client
-    tavily_client = TavilyClient(api_key=api_key)
-    
-    # Determine which domains to include
-    if platform == "combined":
-        include_domains = list(PLATFORM_DOMAINS.values())
-    elif platform in PLATFORM_DOMAINS:
-        include_domains = [PLATFORM_DOMAINS[platform]]
-    else:
-        raise ValueError(
-            f"Invalid platform '{platform}'. Must be one of: "
-            f"{', '.join(list(PLATFORM_DOMAINS.keys()) + ['combined'])}"
-        )
-    
-    # Prepare search parameters
-    search_params = {
-        "query": query,
-        "max_results": max_results,
-        "search_depth": "basic",
-        "include_domains": include_domains,
-        "include_raw_content": False,  # Always False; we handle this manually
-        "include_answer": include_answer,
-    }
+    # Reuse the pooled Tavily client for this key
+    tavily_client = _get_tavily_client(api_key)
     
-
-    if time_range:
-        search_params["time_range"] = time_range
+    search_params = _build_search_params(query, platform, max_results, include_answer, time_range, search_depth)
         
     # Execute the search with retry logic
     search_response = search_with_retry(tavily_client, max_retries, **search_params)
@@ -119,14 +98,7 @@ def social_media_search(
     response = search_response.data
     
     # Early return if no raw content needed or no results
-    results = response.get("results")
-    if not include_raw_content or not results:
-        usage.response_time = time.perf_counter() - start_time
-        response["usage"] = usage.to_dict()
-        return response
-    
-    # Extract URLs in single pass
-    urls = [r["url"] for r in results if "url" in r]
+    urls = _urls_to_extract(response, include_raw_content)
     if not urls:
         usage.response_time = time.perf_counter() - start_time
         response["usage"] = usage.to_dict()
@@ -141,29 +113,180 @@ def social_media_search(
             include_images=include_images
         )
         usage.tavily.add_extract(extract_response.credits, extract_response.response_time)
-        extracted_data = extract_response.data
-        
-        # Build combined mapping in single pass using dict comprehension
-        url_data = {
-            item["url"]: (item.get("raw_content"), item.get("images", []))
-            for item in extracted_data.get("results", [])
-            if "url" in item
-        }
-        
-        # Populate fields with tuple unpacking
-        for result in results:
-            content, images = url_data.get(result.get("url"), (None, []))
-            result["raw_content"] = content
-            result["images"] = images
-                
+        # The retry wrapper reports a failed extract as an "error" key rather than raising
+        if extract_response.data.get("error"):
+            _mark_extraction_failed(response, extract_response.data["error"])
+        else:
+            _merge_extracted(response["results"], extract_response.data)
     except Exception as e:
         # If extraction fails, add error info but still return search results
-        response["extraction_error"] = str(e)
-        for result in results:
-            result["raw_content"] = None
+        _mark_extraction_failed(response, e)
+    
+    usage.response_time = time.perf_counter() - start_time
+    response["usage"] = usage.to_dict()
+    
+    return response
+
+
+async def asocial_media_search(
+    query: str,
+    api_key: str,
+    platform: Literal["tiktok", "facebook", "instagram", "reddit", "linkedin", "x", "combined"] = "combined",
+    include_raw_content: bool = False,
+    max_results: Optional[int] = 5,
+    include_answer: bool = False,
+    include_images: bool = False,
+    time_range: Optional[Literal["day", "week", "month", "year"]] = None,
+    max_retries: int = 1,
+    search_depth: Literal["basic", "advanced"] = "basic",
+) -> Dict[str, Any]:
+    """
+    Async version of social_media_search.
+    
+    Takes the same arguments and returns the same dictionary, but awaits Tavily
+    instead of blocking, so many searches can be in flight on one event loop.
+    
+    Example:
+        >>> results = await asocial_media_search(
+        ...     query="artificial intelligence trends",
+        ...     api_key="tvly-YOUR_API_KEY",
+        ...     platform="reddit",
+        ... )
+    """
+    start_time = time.perf_counter()
+    usage = ToolUsageStats()
+    
+    tavily_client = _get_async_tavily_client(api_key)
+    
+    search_params = _build_search_params(query, platform, max_results, include_answer, time_range, search_depth)
+    
+    search_response = await async_retry(tavily_client.search, max_retries, **search_params)
+    usage.tavily.add_search(search_response.credits, search_response.response_time)
+    response = search_response.data
+    
+    urls = _urls_to_extract(response, include_raw_content)
+    if not urls:
+        usage.response_time = time.perf_counter() - start_time
+        response["usage"] = usage.to_dict()
+        return response
+    
+    try:
+        extract_response = await async_retry(
+            tavily_client.extract, max_retries,
+            urls=urls,
+            extract_depth="advanced",
+            include_images=include_images
+        )
+        usage.tavily.add_extract(extract_response.credits, extract_response.response_time)
+        if extract_response.data.get("error"):
+            _mark_extraction_failed(response, extract_response.data["error"])
+        else:
+            _merge_extracted(response["results"], extract_response.data)
+    except Exception as e:
+        _mark_extraction_failed(response, e)
     
     usage.response_time = time.perf_counter() - start_time
     response["usage"] = usage.to_dict()
     
     return response
 
+
+# Result fields an LLM actually reads; scores, images and usage stats only cost tokens
+RESULT_FIELDS = ("title", "url", "content", "raw_content", "published_date")
+# Long threads are cut so one search cannot flood a model's context window
+MAX_RAW_CONTENT_CHARS = 8000
+
+
+def slim_search_result(
+    response: Dict[str, Any],
+    max_raw_content_chars: Optional[int] = MAX_RAW_CONTENT_CHARS,
+) -> Dict[str, Any]:
+    """
+    Project a social_media_search response down to what a model reads.
+    
+    Keeps the answer, error and extraction_error if present, and the RESULT_FIELDS of each
+    result, with raw_content truncated to ``max_raw_content_chars`` (None keeps it whole).
+    
+    Example:
+        >>> results = await asocial_media_search(query="...", api_key="tvly-YOUR_API_KEY")
+        >>> tool_output = json.dumps(slim_search_result(results))
+    """
+    results = []
+    for r in response.get("results", []):
+        item = {k: r[k] for k in RESULT_FIELDS if r.get(k)}
+        if "raw_content" in item and max_raw_content_chars is not None:
+            item["raw_content"] = item["raw_content"][:max_raw_content_chars]
+        results.append(item)
+    slim = {"answer": response.get("answer"), "results": results}
+    if "error" in response:
+        slim["error"] = response["error"]
+    if "extraction_error" in response:
+        slim["extraction_error"] = response["extraction_error"]
+    return slim
+
+
+def _build_search_params(
+    query: str,
+    platform: str,
+    max_results: Optional[int],
+    include_answer: bool,
+    time_range: Optional[str],
+    search_depth: str,
+) -> Dict[str, Any]:
+    """Build Tavily search kwargs restricted to the platform's domains."""
+    # Determine which domains to include
+    if platform == "combined":
+        include_domains = list(PLATFORM_DOMAINS.values())
+    elif platform in PLATFORM_DOMAINS:
+        include_domains = [PLATFORM_DOMAINS[platform]]
+    else:
+        raise ValueError(
+            f"Invalid platform '{platform}'. Must be one of: "
+            f"{', '.join(list(PLATFORM_DOMAINS.keys()) + ['combined'])}"
+        )
+    
+    # Prepare search parameters
+    search_params = {
+        "query": query,
+        "max_results": max_results,
+        "search_depth": search_depth,
+        "include_domains": include_domains,
+        "include_raw_content": False,  # Always False; we handle this manually
+        "include_answer": include_answer,
+    }
+
+    if time_range:
+        search_params["time_range"] = time_range
+    
+    return search_params
+
+
+def _urls_to_extract(response: Dict[str, Any], include_raw_content: bool) -> list[str]:
+    """Return result URLs to extract, or an empty list when extraction is not needed."""
+    results = response.get("results")
+    if not include_raw_content or not results:
+        return []
+    # Extract URLs in single pass
+    return [r["url"] for r in results if "url" in r]
+
+
+def _merge_extracted(results: list[Dict[str, Any]], extracted_data: Dict[str, Any]) -> None:
+    """Attach extracted raw content and images to the matching search results."""
+    # Build combined mapping in single pass using dict comprehension
+    url_data = {
+        item["url"]: (item.get("raw_content"), item.get("images", []))
+        for item in extracted_data.get("results", [])
+        if "url" in item
+    }
+    
+    # Populate fields with tuple unpacking
+    for result in results:
+        content, images = url_data.get(result.get("url"), (None, []))
+        result["raw_content"] = content
+        result["images"] = images
+
+
+def _mark_extraction_failed(response: Dict[str, Any], error: Union[Exception, str]) -> None:
+    response["extraction_error"] = str(error)
+    for result in response["results"]:
+        result["raw_content"] = None
@@ -7,26 +7,55 @@ powered by Claude as the underlying model.
 Prerequisites:
     pip install anthropic tavily-python python-dotenv
 
+    Set OPENAI_API_KEY as well to cache tool results by query similarity.
+
 Usage:
     # Set ANTHROPIC_API_KEY and TAVILY_API_KEY in .env file
     python chatbot_claude_sdk.py
 """
 
 import asyncio
+import functools
 import json
 import os
 from pathlib import Path
 
+import httpx
 from anthropic import Anthropic
 from dotenv import load_dotenv
+from langchain_openai import OpenAIEmbeddings
 from tavily import TavilyClient
-from tavily_agent_toolkit import handle_research_stream, search_and_format
+from tavily_agent_toolkit import (SemanticCache, handle_research_stream,
+                                  search_and_format)
 
 # Load .env from the same folder as this script
 load_dotenv(Path(__file__).parent / ".env")
 
 TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY", "")
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
+OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
+
+
+@functools.lru_cache(maxsize=1)
+def get_tavily_client() -> TavilyClient:
+    """Return a shared TavilyClient so tool calls reuse one pooled connection."""
+    return TavilyClient(api_key=TAVILY_API_KEY)
+
+
+@functools.lru_cache(maxsize=1)
+def get_anthropic_client() -> Anthropic:
+    """Return a shared Anthropic client so every turn reuses its keep-alive connections."""
+    # Keep the SDK's long read timeout for full responses but fail fast when the API is unreachable
+    return Anthropic(api_key=ANTHROPIC_API_KEY, timeout=httpx.Timeout(600.0, connect=5.0))
+
+
+@functools.lru_cache(maxsize=1)
+def get_semantic_cache() -> SemanticCache | None:
+    """Return a shared tool-result cache, or None when no embeddings key is set."""
+    if not OPENAI_API_KEY:
+        return None
+    return SemanticCache(OpenAIEmbeddings(model="text-embedding-3-small", api_key=OPENAI_API_KEY))
+
 
 # Define tools for Claude
 TOOLS = [
@@ -73,7 +102,9 @@ Parameters:
                 }
             },
             "required": ["input"]
-        }
+        },
+        # Cache breakpoint: the tool definitions are resent unchanged on every agent-loop turn
+        "cache_control": {"type": "ephemeral"}
     }
 ]
 
@@ -89,37 +120,72 @@ CITATIONS: Use numbered in-text citations [1], [2], etc. to back up your claims.
 At the end, include a "Sources:" section with only the sources you actually cited (format: [number] Title - URL).
 """
 
+# Static prefix cached by Anthropic prompt caching. Tool results stay in the
+# messages that follow it, so dynamic content never invalidates the cache.
+SYSTEM = [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+
 
 async def execute_tool(tool_name: str, tool_input: dict) -> str:
     """Execute a tool and return the result."""
     if tool_name == "search_and_format":
         queries = tool_input.get("queries", [])
         time_range = tool_input.get("time_range")
-        result = await search_and_format(
-            queries=queries, 
-            api_key=TAVILY_API_KEY, 
-            time_range=time_range
-        )
-        return result
+
+        async def search() -> str:
+            return await search_and_format(
+                queries=queries, 
+                api_key=TAVILY_API_KEY, 
+                time_range=time_range
+            )
+
+        cache = get_semantic_cache()
+        if cache is None:
+            return await search()
+        return await cache.aget_or_compute("\n".join(queries), search, scope=(tool_name, time_range))
     
     elif tool_name == "stream_research":
         input_prompt = tool_input.get("input", "")
-        client = TavilyClient(api_key=TAVILY_API_KEY)
-        response = client.research(
-            input=input_prompt, 
-            model="mini", 
-            max_results=10, 
-            stream=True
-        )
-        report = handle_research_stream(response, stream_content_generation=False)
-        return json.dumps({"route": "research", "response": report})
+
+        def stream_report() -> str:
+            client = get_tavily_client()
+            response = client.research(
+                input=input_prompt, 
+                model="mini", 
+                max_results=10, 
+                stream=True
+            )
+            return handle_research_stream(response, stream_content_generation=False)
+
+        async def research() -> str:
+            # The research stream is consumed synchronously; run it in a thread so
+            # other tool calls from the same turn keep making progress
+            report = await asyncio.to_thread(stream_report)
+            return json.dumps({"route": "research", "response": report})
+
+        cache = get_semantic_cache()
+        if cache is None:
+            return await research()
+        return await cache.aget_or_compute(input_prompt, research, scope=tool_name)
     
     return f"Unknown tool: {tool_name}"
 
 
+async def execute_tools(tool_uses: list) -> list[dict]:
+    """Run all tool_use blocks from one assistant turn concurrently and return their tool_result blocks."""
+    results = await asyncio.gather(*(execute_tool(block.name, block.input) for block in tool_uses))
+    return [
+        {
+            "type": "tool_result",
+            "tool_use_id": block.id,
+            "content": result
+        }
+        for block, result in zip(tool_uses, results)
+    ]
+
+
 async def run_chatbot():
     """Run an interactive chatbot using Claude with Tavily tools."""
-    client = Anthropic(api_key=ANTHROPIC_API_KEY)
+    client = get_anthropic_client()
     messages = []
     
     print("Claude + Tavily Chatbot ready! Type 'quit' to exit.\n")
@@ -147,7 +213,7 @@ async def run_chatbot():
                 response = client.messages.create(
                     model="claude-haiku-4-5-20251001",
                     max_tokens=4096,
-                    system=SYSTEM_PROMPT,
+                    system=SYSTEM,
                     tools=TOOLS,
                     messages=messages
                 )
@@ -158,18 +224,11 @@ async def run_chatbot():
                     assistant_content = response.content
                     messages.append({"role": "assistant", "content": assistant_content})
                     
-                    tool_results = []
-                    for block in assistant_content:
-                        if block.type == "tool_use":
-                            print(f"[Using {block.name}...] ", end="", flush=True)
-                            result = await execute_tool(block.name, block.input)
-                            tool_results.append({
-                                "type": "tool_result",
-                                "tool_use_id": block.id,
-                                "content": result
-                            })
+                    tool_uses = [block for block in assistant_content if block.type == "tool_use"]
+                    for block in tool_uses:
+                        print(f"[Using {block.name}...] ", end="", flush=True)
                     
-                    messages.append({"role": "user", "content": tool_results})
+                    messages.append({"role": "user", "content": await execute_tools(tool_uses)})
                 
                 else:
                     # Final response - extract and print text
@@ -198,14 +257,14 @@ async def single_query(prompt: str) -> str:
     Returns:
         The assistant's response text.
     """
-    client = Anthropic(api_key=ANTHROPIC_API_KEY)
+    client = get_anthropic_client()
     messages = [{"role": "user", "content": prompt}]
     
     while True:
         response = client.messages.create(
             model="claude-sonnet-4-20250514",
             max_tokens=4096,
-            system=SYSTEM_PROMPT,
+            system=SYSTEM,
             tools=TOOLS,
             messages=messages
         )
@@ -214,17 +273,8 @@ async def single_query(prompt: str) -> str:
             assistant_content = response.content
             messages.append({"role": "assistant", "content": assistant_content})
             
-            tool_results = []
-            for block in assistant_content:
-                if block.type == "tool_use":
-                    result = await execute_tool(block.name, block.input)
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": block.id,
-                        "content": result
-                    })
-            
-            messages.append({"role": "user", "content": tool_results})
+            tool_uses = [block for block in assistant_content if block.type == "tool_use"]
+            messages.append({"role": "user", "content": await execute_tools(tool_uses)})
         else:
             for block in response.content:
                 if hasattr(block, "text"):
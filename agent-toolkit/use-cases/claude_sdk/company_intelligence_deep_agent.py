@@ -3,26 +3,30 @@ Company Intelligence Research Agent
 
 Uses the Claude Agent SDK with custom Tavily-powered MCP tools to research
 companies by crawling websites, extracting content, and searching the web.
+
+Set OPENAI_API_KEY as well to cache tool results by query similarity.
 """
 
 import asyncio
-import json
+import functools
 import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Hashable, Optional
 
 from claude_agent_sdk import (AssistantMessage, ClaudeAgentOptions,
                               ClaudeSDKClient, ResultMessage, TextBlock,
                               ToolUseBlock, create_sdk_mcp_server, tool)
 from dotenv import load_dotenv
-from tavily_agent_toolkit import (ModelConfig, ModelObject,
+from langchain_openai import OpenAIEmbeddings
+from tavily_agent_toolkit import (ModelConfig, ModelObject, SemanticCache,
                                   crawl_and_summarize, extract_and_summarize,
-                                  format_web_results, search_dedup)
+                                  format_web_results, json_dumps, search_dedup)
 
 load_dotenv(Path(__file__).parent / ".env")
 
 TAVILY_API_KEY: str = os.environ.get("TAVILY_API_KEY", "")
 ANTHROPIC_API_KEY: str = os.environ.get("ANTHROPIC_API_KEY", "")
+OPENAI_API_KEY: str = os.environ.get("OPENAI_API_KEY", "")
 
 if not ANTHROPIC_API_KEY:
     raise RuntimeError("ANTHROPIC_API_KEY not set (env or .env).")
@@ -47,6 +51,11 @@ You have three tools available:
 Use these tools as you see fit to gather comprehensive information. \
 Combine website insights with external sources for a complete picture.
 
+When several calls don't depend on each other (e.g. crawling the website \
+while searching for funding and news), request them all in the same turn \
+instead of one per turn. Only wait for a result when your next call depends \
+on it.
+
 When you're done researching, write up your findings in a clear report. \
 Include citations [1], [2], etc. linking to your sources, and list all \
 sources at the end.
@@ -58,6 +67,31 @@ TOOL_LABELS: dict[str, str] = {
     "mcp__company-intel-tools__tavily_search": "Searching the web",
 }
 
+# Tool results are reused for half an hour when the agent repeats or rewords a
+# call with the same URLs and filters
+TOOL_CACHE_TTL = 1800
+
+
+@functools.lru_cache(maxsize=1)
+def get_tool_cache() -> SemanticCache | None:
+    """Return a shared tool-result cache, or None when no embeddings key is set."""
+    if not OPENAI_API_KEY:
+        return None
+    return SemanticCache(
+        OpenAIEmbeddings(model="text-embedding-3-small", api_key=OPENAI_API_KEY),
+        ttl=TOOL_CACHE_TTL,
+    )
+
+
+async def _cached(query: str, compute: Callable[[], Awaitable[dict]], scope: Hashable) -> dict:
+    cache = get_tool_cache()
+    if cache is None:
+        return await compute()
+    # Failed Tavily calls carry an "error" key; don't replay them for the whole TTL
+    return await cache.aget_or_compute(
+        query, compute, scope=scope, cache_if=lambda result: "error" not in result
+    )
+
 # ---------------------------------------------------------------------------
 # MCP Tools
 # ---------------------------------------------------------------------------
@@ -75,14 +109,27 @@ TOOL_LABELS: dict[str, str] = {
     },
 )
 async def crawl_company_website(args: dict[str, Any]) -> dict[str, Any]:
-    result = await crawl_and_summarize(
-        url=args.get("url", ""),
-        model_config=SUMMARIZER_CONFIG,
-        instructions=args.get("instructions"),
-        max_depth=args.get("max_depth", 2),
-        max_breadth=args.get("max_breadth", 10),
-        limit=args.get("limit", 20),
-        api_key=TAVILY_API_KEY,
+    url = args.get("url", "")
+    instructions = args.get("instructions")
+    max_depth = args.get("max_depth", 2)
+    max_breadth = args.get("max_breadth", 10)
+    limit = args.get("limit", 20)
+
+    async def crawl() -> dict:
+        result = await crawl_and_summarize(
+            url=url,
+            model_config=SUMMARIZER_CONFIG,
+            instructions=instructions,
+            max_depth=max_depth,
+            max_breadth=max_breadth,
+            limit=limit,
+            api_key=TAVILY_API_KEY,
+        )
+        # Keep the error so a failed crawl's empty summary is not cached
+        return {k: result[k] for k in ("summary", "error") if k in result}
+
+    result = await _cached(
+        instructions or url, crawl, scope=("crawl", url, max_depth, max_breadth, limit)
     )
     return {"content": [{"type": "text", "text": result.get("summary", "")}]}
 
@@ -96,18 +143,20 @@ async def crawl_company_website(args: dict[str, Any]) -> dict[str, Any]:
     },
 )
 async def extract_from_urls(args: dict[str, Any]) -> dict[str, Any]:
-    result = await extract_and_summarize(
-        urls=args.get("urls") or [],
-        model_config=SUMMARIZER_CONFIG,
-        query=args.get("query"),
-        extract_depth="advanced",
-        api_key=TAVILY_API_KEY,
-    )
-    return {
-        "content": [
-            {"type": "text", "text": json.dumps(result, ensure_ascii=False, indent=2)}
-        ]
-    }
+    urls = args.get("urls") or []
+    query = args.get("query")
+
+    async def extract() -> dict:
+        return await extract_and_summarize(
+            urls=urls,
+            model_config=SUMMARIZER_CONFIG,
+            query=query,
+            extract_depth="advanced",
+            api_key=TAVILY_API_KEY,
+        )
+
+    result = await _cached(query or " ".join(urls), extract, scope=("extract", tuple(urls)))
+    return {"content": [{"type": "text", "text": json_dumps(result, indent=True)}]}
 
 
 @tool(
@@ -127,19 +176,24 @@ async def tavily_search(args: dict[str, Any]) -> dict[str, Any]:
     if isinstance(queries, str):
         queries = [q.strip() for q in queries.split(",") if q.strip()]
     max_results = int(args.get("max_results", 5))
-
-    result = await search_dedup(
-        api_key=TAVILY_API_KEY,
-        queries=queries,
-        max_results=max_results,
-        topic=args.get("topic", "general"),
-        time_range=args.get("time_range"),
-        search_depth="advanced",
-        include_answer=True,
+    topic = args.get("topic", "general")
+    time_range = args.get("time_range")
+
+    async def search() -> dict:
+        return await search_dedup(
+            api_key=TAVILY_API_KEY,
+            queries=queries,
+            max_results=max_results,
+            topic=topic,
+            time_range=time_range,
+            search_depth="advanced",
+            include_answer=True,
+        )
+
+    result = await _cached(
+        "\n".join(queries), search, scope=("search", max_results, topic, time_range)
     )
-    return {
-        "content": [{"type": "text", "text": format_web_results(result.get("results", []))}]
-    }
+    return {"content": [{"type": "text", "text": format_web_results(result.get("results", []))}]}
 
 
 # ---------------------------------------------------------------------------
@@ -8,19 +8,34 @@ real-world opinions, discussions, and insights on any topic.
 Prerequisites:
     pip install anthropic tavily-python python-dotenv
 
+    Set OPENAI_API_KEY as well to cache search results by query similarity.
+
 Usage:
     # Set ANTHROPIC_API_KEY and TAVILY_API_KEY in .env file
     python social_media_research.py
+
+    # Or research several topics at once
+    python social_media_research.py "topic one" "topic two"
 """
 
 import asyncio
+import functools
+import hashlib
 import json
 import os
+import sys
+import time
+import weakref
 from pathlib import Path
+from typing import Any, Callable
 
-from anthropic import Anthropic
+import httpx
+from anthropic import AsyncAnthropic
 from dotenv import load_dotenv
-from tavily_agent_toolkit import social_media_search
+from langchain_openai import OpenAIEmbeddings
+from tavily_agent_toolkit import (HistoryTrimmer, SemanticCache,
+                                  asocial_media_search, json_dumps,
+                                  slim_search_result)
 
 # Load .env from the same folder as this script
 load_dotenv(Path(__file__).parent / ".env")
@@ -28,6 +43,38 @@ load_dotenv(Path(__file__).parent / ".env")
 # Get API keys from environment
 TAVILY_API_KEY: str = os.environ.get("TAVILY_API_KEY", "")
 ANTHROPIC_API_KEY: str = os.environ.get("ANTHROPIC_API_KEY", "")
+OPENAI_API_KEY: str = os.environ.get("OPENAI_API_KEY", "")
+
+# Social posts move fast, so cached search results are only reused for half an hour
+SEARCH_CACHE_TTL = 1800
+
+
+# The client's httpx pool is bound to the loop that opened its connections, so one
+# client is kept per event loop and dropped with it
+_anthropic_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncAnthropic]" = weakref.WeakKeyDictionary()
+
+
+def get_anthropic_client() -> AsyncAnthropic:
+    """Return the running loop's Anthropic client so every turn reuses its keep-alive connections."""
+    loop = asyncio.get_running_loop()
+    client = _anthropic_clients.get(loop)
+    if client is None:
+        # Streamed turns only wait between chunks, so a short read timeout is safe
+        client = _anthropic_clients[loop] = AsyncAnthropic(
+            api_key=ANTHROPIC_API_KEY, timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+    return client
+
+
+@functools.lru_cache(maxsize=1)
+def get_search_cache() -> SemanticCache | None:
+    """Return a shared search-result cache, or None when no embeddings key is set."""
+    if not OPENAI_API_KEY:
+        return None
+    return SemanticCache(
+        OpenAIEmbeddings(model="text-embedding-3-small", api_key=OPENAI_API_KEY),
+        ttl=SEARCH_CACHE_TTL,
+    )
 
 # Define tools for Claude
 TOOLS = [
@@ -64,7 +111,9 @@ You can search a specific platform or all platforms at once with "combined".""",
                 }
             },
             "required": ["query"]
-        }
+        },
+        # Cache breakpoint: the tool definitions are resent unchanged on every research turn
+        "cache_control": {"type": "ephemeral"}
     }
 ]
 
@@ -72,10 +121,66 @@ SYSTEM_PROMPT = """You research topics by searching social media platforms (TikT
 
 Search multiple times with different queries or platforms to get a complete picture. Reddit is great for honest opinions, TikTok for trends, X for real-time reactions, LinkedIn for professional takes.
 
+When you need several searches that don't depend on each other (e.g. the same topic on Reddit, TikTok and X), request them all in the same turn. They run in parallel.
+
 Synthesize what you find into a clear answer. Include inline citations [1], [2] and list sources with URLs at the end."""
 
+# Static prefix cached by Anthropic prompt caching, so later turns of a session
+# only pay full input cost for the messages after it
+SYSTEM = [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+
 
-def execute_tool(tool_name: str, tool_input: dict) -> str:
+# Exact-match cache of Claude responses keyed on the whole request. Tool-use turns
+# go stale sooner than final answers because they drive fresh searches.
+TOOL_TURN_TTL = 3600
+FINAL_TURN_TTL = 86400
+RESPONSE_CACHE_SIZE = 256
+_response_cache: dict[str, tuple[float, Any]] = {}
+
+
+def _request_key(request: dict) -> str:
+    payload = json.dumps(
+        request,
+        sort_keys=True,
+        default=lambda o: o.model_dump() if hasattr(o, "model_dump") else str(o),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def stream_message(
+    client: AsyncAnthropic, on_tool_use: Callable[[Any], None], **request: Any
+) -> Any:
+    """Stream a Claude turn and return the final message.
+    
+    ``on_tool_use`` is called with each tool_use block as soon as it has been fully
+    generated, so its search can start while Claude is still writing the rest of
+    the turn. The response to an identical request is reused while it is fresh.
+    """
+    key = _request_key(request)
+    cached = _response_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        response = cached[1]
+        for block in response.content:
+            if block.type == "tool_use":
+                on_tool_use(block)
+        return response
+    
+    async with client.messages.stream(**request) as stream:
+        async for event in stream:
+            if event.type == "content_block_stop":
+                block = stream.current_message_snapshot.content[event.index]
+                if block.type == "tool_use":
+                    on_tool_use(block)
+        response = await stream.get_final_message()
+    
+    ttl = TOOL_TURN_TTL if response.stop_reason == "tool_use" else FINAL_TURN_TTL
+    _response_cache[key] = (time.monotonic() + ttl, response)
+    if len(_response_cache) > RESPONSE_CACHE_SIZE:
+        del _response_cache[next(iter(_response_cache))]
+    return response
+
+
+async def execute_tool(tool_name: str, tool_input: dict) -> str:
     """Execute a tool and return the result."""
     if tool_name == "search_social_media":
         query = tool_input.get("query", "")
@@ -84,17 +189,31 @@ def execute_tool(tool_name: str, tool_input: dict) -> str:
         include_raw_content = tool_input.get("include_raw_content", True)
         time_range = tool_input.get("time_range", "month")
         
-        result = social_media_search(
-            query=query,
-            api_key=TAVILY_API_KEY,
-            platform=platform,
-            include_raw_content=include_raw_content,
-            max_results=max_results,
-            search_depth="advanced",
-            include_answer=True,
-            time_range=time_range,
+        async def search() -> dict:
+            result = await asocial_media_search(
+                query=query,
+                api_key=TAVILY_API_KEY,
+                platform=platform,
+                include_raw_content=include_raw_content,
+                max_results=max_results,
+                search_depth="advanced",
+                include_answer=True,
+                time_range=time_range,
+            )
+            return slim_search_result(result)
+        
+        # Reuse results for the same or a reworded query with identical filters. Results
+        # missing raw content after a failed extract are returned but not cached.
+        cache = get_search_cache()
+        if cache is None:
+            return json_dumps(await search())
+        result = await cache.aget_or_compute(
+            query,
+            search,
+            scope=(platform, time_range, max_results, include_raw_content),
+            cache_if=lambda result: "error" not in result and "extraction_error" not in result,
         )
-        return json.dumps(result)
+        return json_dumps(result)
     
     return f"Unknown tool: {tool_name}"
 
@@ -109,37 +228,76 @@ async def run_research(query: str) -> str:
     Returns:
         The research report as a string.
     """
-    client = Anthropic(api_key=ANTHROPIC_API_KEY)
+    client = get_anthropic_client()
     messages = [{"role": "user", "content": query}]
+    cache_breakpoint: dict | None = None
+    # Drops raw post content from earlier turns once enough has built up
+    trimmer = HistoryTrimmer()
     
     while True:
-        response = client.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=4096,
-            system=SYSTEM_PROMPT,
-            tools=TOOLS,
-            messages=messages
-        )
+        tool_uses = []
+        searches = []
+        started: dict[tuple[str, str], asyncio.Task] = {}
+        
+        def dispatch(block: Any) -> None:
+            # Start each search the moment its tool call is complete, overlapping
+            # Tavily latency with the rest of Claude's turn. Repeated calls in the
+            # same turn share one search.
+            key = (block.name, json.dumps(block.input, sort_keys=True))
+            if key not in started:
+                print(f"  [Searching social media on {block.input.get('platform', 'all social media platforms')}...] ", flush=True)
+                started[key] = asyncio.create_task(execute_tool(block.name, block.input))
+            tool_uses.append(block)
+            searches.append(started[key])
+        
+        try:
+            response = await stream_message(
+                client,
+                dispatch,
+                model="claude-haiku-4-5-20251001",
+                max_tokens=4096,
+                system=SYSTEM,
+                tools=TOOLS,
+                messages=messages
+            )
+        except BaseException:
+            for task in searches:
+                task.cancel()
+            raise
         
         if response.stop_reason == "tool_use":
-            # Process all tool calls
-            assistant_content = response.content
-            messages.append({"role": "assistant", "content": assistant_content})
+            messages.append({"role": "assistant", "content": response.content})
+            results = await asyncio.gather(*searches, return_exceptions=True)
             
             tool_results = []
-            for block in assistant_content:
-                if block.type == "tool_use":
-                    print(f"  [Searching social media on {block.input.get('platform', 'all social media platforms')}...] ", flush=True)
-                    result = execute_tool(block.name, block.input)
+            for block, result in zip(tool_uses, results):
+                if isinstance(result, Exception):
+                    tool_results.append({
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": f"Error: {result}",
+                        "is_error": True
+                    })
+                else:
                     tool_results.append({
                         "type": "tool_result",
                         "tool_use_id": block.id,
                         "content": result
                     })
             
+            # Move the conversation cache breakpoint to the newest tool results so the
+            # next turn reads the whole history before them from the prompt cache
+            if cache_breakpoint is not None:
+                del cache_breakpoint["cache_control"]
+            cache_breakpoint = tool_results[-1]
+            cache_breakpoint["cache_control"] = {"type": "ephemeral"}
+            
             messages.append({"role": "user", "content": tool_results})
+            trimmer.add_turn(messages, tool_results)
         
         else:
+            for task in searches:
+                task.cancel()
             # Final response - extract and return text
             for block in response.content:
                 if hasattr(block, "text"):
@@ -147,6 +305,30 @@ async def run_research(query: str) -> str:
             return ""
 
 
+# Sessions run at once by run_research_batch, kept low to stay within API rate limits
+MAX_CONCURRENT_SESSIONS = 4
+
+
+async def run_research_batch(queries: list[str]) -> list[str]:
+    """
+    Run independent research sessions concurrently.
+    
+    Args:
+        queries: The research questions or topics.
+        
+    Returns:
+        One report per query, in order. A failed session yields an "Error: ..." string.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SESSIONS)
+    
+    async def run_one(query: str) -> str:
+        async with semaphore:
+            return await run_research(query)
+    
+    reports = await asyncio.gather(*(run_one(q) for q in queries), return_exceptions=True)
+    return [f"Error: {r}" if isinstance(r, BaseException) else r for r in reports]
+
+
 async def main():
     """Social media research CLI."""
     print("=" * 60)
@@ -165,21 +347,24 @@ async def main():
         print("  Add it to .env or run: export TAVILY_API_KEY=your-api-key")
         return
     
-    query = input("What would you like to research?\n> ").strip()
-    
-    if not query:
-        print("No query provided.")
-        return
+    queries = [q.strip() for q in sys.argv[1:] if q.strip()]
+    if not queries:
+        query = input("What would you like to research?\n> ").strip()
+        if not query:
+            print("No query provided.")
+            return
+        queries = [query]
     
     print("\n" + "-" * 60)
     print("Researching...\n")
     
-    report = await run_research(query)
+    reports = await run_research_batch(queries)
     
-    print("\n" + "=" * 60)
-    print("REPORT")
-    print("=" * 60 + "\n")
-    print(report)
+    for query, report in zip(queries, reports):
+        print("\n" + "=" * 60)
+        print(f"REPORT: {query}" if len(queries) > 1 else "REPORT")
+        print("=" * 60 + "\n")
+        print(report)
 
 
 if __name__ == "__main__":
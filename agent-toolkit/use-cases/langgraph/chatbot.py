@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import os
 from pathlib import Path
 
@@ -9,10 +10,26 @@ load_dotenv(Path(__file__).parent / ".env")
 
 from langchain.agents import create_agent
 from langchain_core.tools import tool
-from tavily_agent_toolkit import (ModelConfig, ModelObject,
+from langchain_openai import OpenAIEmbeddings
+from tavily_agent_toolkit import (ModelConfig, ModelObject, SemanticCache,
                                   handle_research_stream, search_and_format)
 
 TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY", "")
+OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
+
+
+@functools.lru_cache(maxsize=1)
+def get_tavily_client() -> TavilyClient:
+    """Return a shared TavilyClient so tool calls reuse one pooled connection."""
+    return TavilyClient(api_key=TAVILY_API_KEY)
+
+
+@functools.lru_cache(maxsize=1)
+def get_semantic_cache() -> SemanticCache | None:
+    """Return a shared tool-result cache, or None when no embeddings key is set."""
+    if not OPENAI_API_KEY:
+        return None
+    return SemanticCache(OpenAIEmbeddings(model="text-embedding-3-small", api_key=OPENAI_API_KEY))
 
 
 def create_chatbot_agent(model_config: ModelConfig):
@@ -26,7 +43,13 @@ def create_chatbot_agent(model_config: ModelConfig):
         - queries: List of search queries. Use concise, Google-style queries. Can be 1 or more queries.
         - time_range: Optional time filter: "day", "week", "month", or "year"
         """
-        return await search_and_format(queries=queries, api_key=TAVILY_API_KEY, time_range=time_range)
+        async def search() -> str:
+            return await search_and_format(queries=queries, api_key=TAVILY_API_KEY, time_range=time_range)
+
+        cache = get_semantic_cache()
+        if cache is None:
+            return await search()
+        return await cache.aget_or_compute("\n".join(queries), search, scope=("search_and_format", time_range))
 
     @tool
     async def stream_research_tool(input: str) -> dict:
@@ -41,10 +64,19 @@ def create_chatbot_agent(model_config: ModelConfig):
             Share what's already known. Include prior assumptions, existing decisions, or baseline knowledge—so the research doesn't repeat what you already have.
             Keep the prompt clean and directed. Use a clear task statement + essential context + desired output format. Avoid messy background dumps.
         """
-        client = TavilyClient(api_key=TAVILY_API_KEY)
-        response = client.research(input=input, model="mini", max_results=10, stream=True)
-        report = handle_research_stream(response, stream_content_generation=False)
-        return {"route": "research", "response": report}
+        def stream_report() -> str:
+            response = get_tavily_client().research(input=input, model="mini", max_results=10, stream=True)
+            return handle_research_stream(response, stream_content_generation=False)
+
+        async def research() -> dict:
+            # Consume the synchronous stream in a thread so parallel tool calls are not blocked
+            report = await asyncio.to_thread(stream_report)
+            return {"route": "research", "response": report}
+
+        cache = get_semantic_cache()
+        if cache is None:
+            return await research()
+        return await cache.aget_or_compute(input, research, scope="stream_research")
     
     return create_agent(
         model=model_config.model.model,
@@ -18,8 +18,9 @@ from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent / ".env")
 
 from langchain.agents import create_agent
-from langchain_openai import ChatOpenAI
-from tavily_agent_toolkit import (ModelConfig, ModelObject,
+from langchain_core.caches import InMemoryCache
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from tavily_agent_toolkit import (ModelConfig, ModelObject, SemanticCache,
                                   crawl_and_summarize, extract_and_summarize,
                                   format_web_results, search_dedup)
 
@@ -40,19 +41,37 @@ SUMMARIZER_CONFIG = ModelConfig(
     ),
 )
 
+# Tool results are reused for half an hour when the agent repeats or rewords a
+# call with the same URLs and filters
+tool_cache = SemanticCache(
+    OpenAIEmbeddings(model="text-embedding-3-small", api_key=OPENAI_API_KEY),
+    ttl=1800,
+)
+
+
+def _succeeded(result: dict) -> bool:
+    """Cache predicate: failed Tavily calls carry an "error" key and are not replayed."""
+    return "error" not in result
+
 async def stream_agent_response(agent, inputs: dict) -> str:
     """Stream agent execution, printing tool calls/completions, and return final response."""
     final_response = None
     async for chunk in agent.astream(inputs, stream_mode="updates"):
         for node_output in chunk.values():
             for msg in node_output.get("messages", []):
-                if hasattr(msg, "tool_calls") and msg.tool_calls:
-                    for tool_call in msg.tool_calls:
+                # One getattr per field instead of hasattr followed by a second lookup
+                tool_calls = getattr(msg, "tool_calls", None)
+                if tool_calls:
+                    for tool_call in tool_calls:
                         print(f"🔧 Calling: {tool_call['name']}")
-                elif hasattr(msg, "name") and msg.name:
-                    print(f"✅ {msg.name} completed")
-                elif hasattr(msg, "content") and msg.content:
-                    final_response = msg.content
+                    continue
+                name = getattr(msg, "name", None)
+                if name:
+                    print(f"✅ {name} completed")
+                    continue
+                content = getattr(msg, "content", None)
+                if content:
+                    final_response = content
     return final_response or "No response generated"
 
 async def crawl_company_website(
@@ -76,16 +95,25 @@ async def crawl_company_website(
     Returns:
         Dictionary containing crawled results and a summary of the website content.
     """
-    # Run the async function synchronously
-    result = await crawl_and_summarize(
-            url=url,
-            model_config=SUMMARIZER_CONFIG,
-            instructions=instructions,
-            max_depth=max_depth,
-            max_breadth=max_breadth,
-            limit=limit,
-            api_key=TAVILY_API_KEY,
-        )
+    async def crawl() -> dict:
+        result = await crawl_and_summarize(
+                url=url,
+                model_config=SUMMARIZER_CONFIG,
+                instructions=instructions,
+                max_depth=max_depth,
+                max_breadth=max_breadth,
+                limit=limit,
+                api_key=TAVILY_API_KEY,
+            )
+        # Keep the error so a failed crawl's empty summary is not cached
+        return {k: result[k] for k in ("summary", "error") if k in result}
+
+    result = await tool_cache.aget_or_compute(
+        instructions or url,
+        crawl,
+        scope=("crawl", url, max_depth, max_breadth, limit),
+        cache_if=_succeeded,
+    )
     return result["summary"]
 
 
@@ -104,14 +132,18 @@ async def extract_from_urls(
     Returns:
         Dictionary containing extracted results with summaries for each URL.
     """
-    # Run the async function synchronously
-    return await extract_and_summarize(
+    return await tool_cache.aget_or_compute(
+        query or " ".join(urls),
+        lambda: extract_and_summarize(
             urls=urls,
             model_config=SUMMARIZER_CONFIG,
             query=query,
             extract_depth="advanced",
             api_key=TAVILY_API_KEY,
-        )
+        ),
+        scope=("extract", tuple(urls)),
+        cache_if=_succeeded,
+    )
 
 async def tavily_search(
     queries: List[str],
@@ -131,7 +163,15 @@ async def tavily_search(
     Returns:
         Dictionary containing deduplicated search results with URLs, titles, and content.
     """
-    result = await search_dedup(api_key=TAVILY_API_KEY, queries=queries, max_results=max_results, topic=topic, time_range=time_range, search_depth="advanced", include_answer=True)
+    async def search() -> dict:
+        return await search_dedup(api_key=TAVILY_API_KEY, queries=queries, max_results=max_results, topic=topic, time_range=time_range, search_depth="advanced", include_answer=True)
+
+    result = await tool_cache.aget_or_compute(
+        "\n".join(queries),
+        search,
+        scope=("search", max_results, topic, time_range),
+        cache_if=_succeeded,
+    )
     return format_web_results(result["results"])
 
 
@@ -145,11 +185,14 @@ You have three tools available:
 
 Use these tools as you see fit to gather comprehensive information. Combine website insights with external sources for a complete picture.
 
+When several calls don't depend on each other (e.g. crawling the website while searching for funding and news), request them all in the same turn. They run in parallel. Only wait for a result when your next call depends on it.
+
 When you're done researching, write up your findings in a clear report. Include citations [1], [2], etc. linking to your sources, and list all sources at the end.
 """
 
 # Create the ReAct agent with OpenAI
-model = ChatOpenAI(model="gpt-5-mini")
+# Identical prompts (same messages and tools) are answered from memory
+model = ChatOpenAI(model="gpt-5-mini", cache=InMemoryCache(maxsize=256))
 agent = create_agent(
     model=model,
     tools=[crawl_company_website, extract_from_urls, tavily_search],
@@ -18,9 +18,11 @@ from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent / ".env")
 
 from langchain.agents import create_agent
+from langchain_core.caches import InMemoryCache
 from langchain_core.tools import tool
-from langchain_openai import ChatOpenAI
-from tavily_agent_toolkit import social_media_search
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from tavily_agent_toolkit import (SemanticCache, asocial_media_search,
+                                  slim_search_result)
 
 # Get API keys from environment
 TAVILY_API_KEY: str = os.environ.get("TAVILY_API_KEY", "")
@@ -31,23 +33,36 @@ if not TAVILY_API_KEY:
 if not OPENAI_API_KEY:
     raise ValueError("OPENAI_API_KEY environment variable is required")
 
+# Repeated or reworded searches with the same filters reuse results for half an hour
+search_cache = SemanticCache(
+    OpenAIEmbeddings(model="text-embedding-3-small", api_key=OPENAI_API_KEY),
+    ttl=1800,
+)
+
 async def stream_agent_response(agent, inputs: dict) -> str:
     """Stream agent execution, printing tool calls/completions, and return final response."""
     final_response = None
     async for chunk in agent.astream(inputs, stream_mode="updates"):
         for node_output in chunk.values():
             for msg in node_output.get("messages", []):
-                if hasattr(msg, "tool_calls") and msg.tool_calls:
-                    for tool_call in msg.tool_calls:
+                # One getattr per field instead of hasattr followed by a second lookup
+                tool_calls = getattr(msg, "tool_calls", None)
+                if tool_calls:
+                    for tool_call in tool_calls:
                         print(f"🔧 Calling: {tool_call['name']}")
-                elif hasattr(msg, "name") and msg.name:
-                    print(f"✅ {msg.name} completed")
-                elif hasattr(msg, "content") and msg.content:
-                    final_response = msg.content
+                    continue
+                name = getattr(msg, "name", None)
+                if name:
+                    print(f"✅ {name} completed")
+                    continue
+                content = getattr(msg, "content", None)
+                if content:
+                    final_response = content
     return final_response or "No response generated"
 
+
 @tool
-def search_social_media(
+async def search_social_media(
     query: str,
     platform: Literal["tiktok", "facebook", "instagram", "reddit", "linkedin", "x", "combined"] = "combined",
     max_results: int = 10,
@@ -75,15 +90,25 @@ def search_social_media(
         Dictionary containing search results with titles, URLs, content snippets,
         and optionally full raw content from each social media post.
     """
-    return social_media_search(
-        query=query,
-        api_key=TAVILY_API_KEY,
-        platform=platform,
-        include_raw_content=include_raw_content,
-        max_results=max_results,
-        search_depth="advanced",
-        include_answer=True,
-        time_range=time_range,
+    async def search() -> dict:
+        result = await asocial_media_search(
+            query=query,
+            api_key=TAVILY_API_KEY,
+            platform=platform,
+            include_raw_content=include_raw_content,
+            max_results=max_results,
+            search_depth="advanced",
+            include_answer=True,
+            time_range=time_range,
+        )
+        return slim_search_result(result)
+
+    # Results missing raw content after a failed extract are returned but not cached
+    return await search_cache.aget_or_compute(
+        query,
+        search,
+        scope=(platform, time_range, max_results, include_raw_content),
+        cache_if=lambda result: "error" not in result and "extraction_error" not in result,
     )
 
 
@@ -91,10 +116,13 @@ SYSTEM_PROMPT = """You research topics by searching social media platforms (TikT
 
 Search multiple times with different queries or platforms to get a complete picture. Reddit is great for honest opinions, TikTok for trends, X for real-time reactions, LinkedIn for professional takes.
 
+When you need several searches that don't depend on each other (e.g. the same topic on Reddit, TikTok and X), request them all in the same turn. They run in parallel.
+
 Synthesize what you find into a clear answer. Include inline citations [1], [2] and list sources with URLs at the end."""
 
 
-model = ChatOpenAI(model="gpt-5.1", api_key=OPENAI_API_KEY)
+# Identical prompts (same messages and tools) are answered from memory
+model = ChatOpenAI(model="gpt-5.1", api_key=OPENAI_API_KEY, cache=InMemoryCache(maxsize=256))
 agent = create_agent(
     model=model,
     tools=[search_social_media],
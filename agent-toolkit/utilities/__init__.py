@@ -1,6 +1,7 @@
 # Tavily Research Helpers
 from .utils import (
     ainvoke_with_fallback,
+    astream_with_fallback,
     clean_raw_content,
     clean_formatted_output,
     count_tokens,
@@ -9,10 +10,14 @@ from .utils import (
     synthesize_results,
     format_web_results,
 )
+from .fast_json import json_dumps, json_loads
+from .history import HistoryTrimmer, trim_history
 from .research_stream import handle_research_stream
+from .semantic_cache import SemanticCache
 
 __all__ = [
     "ainvoke_with_fallback",
+    "astream_with_fallback",
     "clean_raw_content",
     "clean_formatted_output",
     "count_tokens",
@@ -21,4 +26,9 @@ __all__ = [
     "synthesize_results",
     "format_web_results",
     "handle_research_stream",
+    "json_dumps",
+    "json_loads",
+    "SemanticCache",
+    "HistoryTrimmer",
+    "trim_history",
 ]
@@ -0,0 +1,22 @@
+import json
+from typing import Any
+
+# orjson (installed with langsmith on CPython) encodes and parses several times
+# faster than the stdlib. Both paths write compact JSON with non-ASCII text as-is,
+# and orjson's JSONDecodeError subclasses json's, so callers can catch either.
+try:
+    import orjson
+
+    def json_dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize ``obj`` to a JSON string, indented by two spaces if ``indent``."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode()
+
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize ``obj`` to a JSON string, indented by two spaces if ``indent``."""
+        if indent:
+            return json.dumps(obj, ensure_ascii=False, indent=2)
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    json_loads = json.loads
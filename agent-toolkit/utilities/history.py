@@ -0,0 +1,60 @@
+from typing import Any
+
+from .fast_json import json_dumps, json_loads
+
+# Once untrimmed tool results from earlier turns pass this many characters, their raw
+# post content is dropped. Rewriting history costs one prompt-cache miss, so it only
+# happens again after another MAX_HISTORY_CHARS of results has built up.
+MAX_HISTORY_CHARS = 200_000
+
+
+def trim_history(messages: list[dict[str, Any]]) -> None:
+    """Drop raw_content from tool results before the newest turn, in place."""
+    for message in messages[:-1]:
+        if message["role"] != "user" or isinstance(message["content"], str):
+            continue
+        for block in message["content"]:
+            if block.get("is_error"):
+                continue
+            try:
+                data = json_loads(block["content"])
+            except ValueError:
+                continue
+            if isinstance(data, dict):
+                for r in data.get("results", []):
+                    r.pop("raw_content", None)
+                block["content"] = json_dumps(data)
+
+
+class HistoryTrimmer:
+    """Decides when a tool-use loop should trim raw content from its message history.
+
+    Tool results stay whole while they are the newest turn, since the model has not
+    read them yet. Once older results that still carry raw content pass ``max_chars``,
+    they are trimmed with ``trim_history`` and the count starts again.
+
+    Example:
+        trimmer = HistoryTrimmer()
+        messages.append({"role": "user", "content": tool_results})
+        trimmer.add_turn(messages, tool_results)
+    """
+
+    def __init__(self, max_chars: int = MAX_HISTORY_CHARS):
+        """
+        Args:
+            max_chars: Characters of untrimmed earlier tool results that trigger a trim.
+        """
+        self.max_chars = max_chars
+        # Size of tool results from earlier turns that still carry raw content, and of the newest turn's
+        self.untrimmed_chars = 0
+        self.newest_chars = 0
+
+    def add_turn(self, messages: list[dict[str, Any]], tool_results: list[dict[str, Any]]) -> bool:
+        """Account for ``tool_results``, just appended to ``messages``; return True if history was trimmed."""
+        self.untrimmed_chars += self.newest_chars
+        self.newest_chars = sum(len(r["content"]) for r in tool_results)
+        if self.untrimmed_chars <= self.max_chars:
+            return False
+        trim_history(messages)
+        self.untrimmed_chars = 0
+        return True
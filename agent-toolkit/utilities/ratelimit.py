@@ -0,0 +1,42 @@
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Async token bucket limiting how often a shared resource is hit.
+
+    Tokens refill at ``rate`` per second up to ``burst``. Each ``acquire`` reserves
+    a token immediately (the balance may go negative) and sleeps off its share of
+    the deficit, so concurrent callers are spaced out in arrival order. No lock
+    is needed because the reservation happens without yielding to the event loop,
+    which also keeps one bucket usable across separate event loops.
+
+    Example:
+        limiter = TokenBucket(rate=20)
+        async with limiter:
+            response = await client.get(url)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
@@ -1,5 +1,8 @@
+import codecs
 import json
-from typing import Any
+from typing import Any, AsyncIterator
+
+from .fast_json import json_loads
 
 
 def handle_research_stream(response: Any, verbose: bool = True, stream_content_generation: bool = True) -> str:
@@ -84,6 +87,56 @@ def handle_research_stream(response: Any, verbose: bool = True, stream_content_g
     return full_report
 
 
+async def _collect_research_stream(response: AsyncIterator[bytes]) -> tuple[str, list[dict[str, Any]]]:
+    """
+    Consume an async Tavily Research stream without printing.
+    
+    Unlike handle_research_stream, lines and multi-byte characters split across
+    chunks are buffered until complete, which matters for the arbitrary byte
+    chunks httpx yields.
+    
+    Returns the full report content and the list of sources.
+    
+    Raises:
+        RuntimeError: If the stream ends before its ``done`` event, so a truncated
+            report is never mistaken for a finished one.
+    """
+    full_report = ""
+    sources: list[dict[str, Any]] = []
+    printed_tool_calls: set = set()
+    current_event_type = None
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    
+    async for chunk in response:
+        pending += decoder.decode(chunk) if isinstance(chunk, bytes) else str(chunk)
+        *lines, pending = pending.split("\n")
+        
+        for raw_line in lines:
+            stripped = raw_line.strip()
+            
+            if not stripped:
+                current_event_type = None
+            elif stripped.startswith("event:"):
+                current_event_type = stripped.split("event:", 1)[1].strip()
+                if current_event_type == "done":
+                    return full_report, sources
+            elif stripped.startswith("data:") and current_event_type:
+                full_report = _process_event(
+                    current_event_type,
+                    stripped.split("data:", 1)[1].strip(),
+                    False,
+                    False,
+                    printed_tool_calls,
+                    full_report_ref=[full_report],
+                    sources_ref=sources
+                )
+    
+    # Surfaces a multi-byte character cut off by the end of the stream
+    decoder.decode(b"", final=True)
+    raise RuntimeError("Research stream ended before the done event")
+
+
 def _process_event(
     event_type: str,
     data_str: str,
@@ -100,7 +153,7 @@ def _process_event(
         return full_report
     
     try:
-        data = json.loads(data_str)
+        data = json_loads(data_str)
     except json.JSONDecodeError:
         return full_report
     
@@ -0,0 +1,137 @@
+import math
+import operator
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+
+from langchain_core.embeddings import Embeddings
+
+T = TypeVar("T")
+
+
+class SemanticCache:
+    """In-process cache keyed on query meaning rather than exact text.
+
+    A query identical to a cached one in the same scope is answered without
+    calling the embeddings model. Otherwise the query is embedded and compared by
+    cosine similarity against cached queries in the same scope; the closest one
+    above ``threshold`` is a hit. Entries expire after ``ttl`` seconds and the
+    least recently used entry is evicted once ``max_entries`` is reached.
+
+    Example:
+        cache = SemanticCache(OpenAIEmbeddings(model="text-embedding-3-small"))
+        result = await cache.aget_or_compute(query, lambda: search_and_format(...))
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        threshold: float = 0.92,
+        max_entries: int = 256,
+        ttl: Optional[float] = 3600.0,
+    ):
+        """
+        Args:
+            embeddings: Any LangChain embeddings model.
+            threshold: Minimum cosine similarity for a cached query to count as a hit.
+            max_entries: Maximum number of cached responses.
+            ttl: Seconds before an entry expires, or None to keep entries until evicted.
+        """
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (scope, unit vector, stored_at, value)
+        self._entries: OrderedDict[int, tuple[Hashable, list[float], float, Any]] = OrderedDict()
+        # (scope, query) -> key, for hits that need no embedding
+        self._exact: dict[tuple[Hashable, str], int] = {}
+        self._next_key = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._exact.clear()
+
+    def _lookup_exact(self, query: str, scope: Hashable) -> tuple[bool, Any]:
+        key = self._exact.get((scope, query))
+        if key is None or key not in self._entries:
+            return False, None
+        stored_at, value = self._entries[key][2:]
+        if self.ttl is not None and time.monotonic() - stored_at >= self.ttl:
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    async def _aembed(self, text: str) -> list[float]:
+        vector = await self.embeddings.aembed_query(text)
+        norm = math.sqrt(sum(map(operator.mul, vector, vector))) or 1.0
+        return [x / norm for x in vector]
+
+    def _lookup(self, vector: list[float], scope: Hashable) -> Optional[Any]:
+        now = time.monotonic()
+        best_key, best_score = None, self.threshold
+
+        for key, (entry_scope, entry_vector, stored_at, _) in list(self._entries.items()):
+            if self.ttl is not None and now - stored_at >= self.ttl:
+                del self._entries[key]
+                continue
+            if entry_scope != scope:
+                continue
+            score = sum(map(operator.mul, vector, entry_vector))
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][3]
+
+    def _store(self, query: str, vector: list[float], scope: Hashable, value: Any) -> None:
+        self._entries[self._next_key] = (scope, vector, time.monotonic(), value)
+        self._exact[(scope, query)] = self._next_key
+        self._next_key += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        if len(self._exact) > 2 * self.max_entries:
+            self._exact = {k: v for k, v in self._exact.items() if v in self._entries}
+
+    async def aget(self, query: str, scope: Hashable = None) -> Optional[Any]:
+        """Return the cached response for a query similar to ``query``, or None."""
+        found, value = self._lookup_exact(query, scope)
+        if found:
+            return value
+        return self._lookup(await self._aembed(query), scope)
+
+    async def aset(self, query: str, value: Any, scope: Hashable = None) -> None:
+        """Cache ``value`` as the response for ``query``."""
+        self._store(query, await self._aembed(query), scope, value)
+
+    async def aget_or_compute(
+        self,
+        query: str,
+        compute: Callable[[], Awaitable[T]],
+        scope: Hashable = None,
+        cache_if: Optional[Callable[[T], bool]] = None,
+    ) -> T:
+        """Return a cached response for ``query``, or await ``compute()`` and cache it.
+
+        Args:
+            query: Text to match against cached queries.
+            compute: Zero-argument coroutine factory producing the response on a miss.
+            scope: Extra key that must match exactly (e.g. a time_range filter).
+            cache_if: Optional predicate; computed values it rejects (e.g. partial
+                results after a transient failure) are returned but not cached.
+        """
+        found, cached = self._lookup_exact(query, scope)
+        if found:
+            return cached
+        vector = await self._aembed(query)
+        cached = self._lookup(vector, scope)
+        if cached is not None:
+            return cached
+        value = await compute()
+        if cache_if is None or cache_if(value):
+            self._store(query, vector, scope, value)
+        return value
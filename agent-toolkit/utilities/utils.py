@@ -1,18 +1,58 @@
 import asyncio
+import functools
+import os
+import random
 import re
 import time
-from typing import (Any, Callable, Optional, Sequence, Type, TypeVar, Union,
-                    cast)
+import weakref
+from typing import (Any, AsyncIterator, Callable, Optional, Sequence, Type,
+                    TypeVar, Union, cast)
 
 import tiktoken
 from langchain.chat_models import init_chat_model
 from pydantic import BaseModel
+from tavily import AsyncTavilyClient, TavilyClient
+from tavily.errors import (BadRequestError, ForbiddenError, InvalidAPIKeyError,
+                           MissingAPIKeyError)
 
-from ..models import (LLMResponse, LLMUsage, ModelConfig, SearchResult,
-                      TavilyAPIResponse)
+from ..models import (LLMResponse, LLMUsage, ModelConfig, OutputSchema,
+                      SearchResult, TavilyAPIResponse)
 
 T = TypeVar("T")
 
+# Upper bound (seconds) for the jittered exponential backoff between retries
+_RETRY_BACKOFF_CAP = 30.0
+# Upper bound (seconds) for honouring a server retry-after hint, so one bad header
+# cannot stall a retry loop for minutes
+_RETRY_AFTER_CAP = 60.0
+
+# Client-side errors that fail the same way on every attempt, so retrying only burns time
+_NON_RETRYABLE_ERRORS = (BadRequestError, ForbiddenError, InvalidAPIKeyError, MissingAPIKeyError)
+
+
+def _retry_wait_time(retry_count: int, error: Exception) -> float:
+    """Full-jitter exponential backoff, extended to any retry-after hint on the error (up to _RETRY_AFTER_CAP).
+    
+    Randomizing the wait keeps concurrent callers that hit the same rate limit
+    from retrying in lockstep.
+    """
+    wait_time = min(_RETRY_BACKOFF_CAP, random.uniform(0, 2 ** retry_count))
+    retry_after = getattr(error, "retry_after", None) or getattr(error, "retry_after_seconds", None)
+    if retry_after:
+        try:
+            wait_time = max(wait_time, min(float(retry_after), _RETRY_AFTER_CAP))
+        except (TypeError, ValueError):
+            pass
+    return wait_time
+
+
+def _credits_of(result: Any) -> int:
+    """Return the credits reported in a Tavily response, or 0 if absent."""
+    try:
+        return result["usage"]["credits"]
+    except (KeyError, TypeError):
+        return 0
+
 
 async def async_retry(
     func: Callable[..., Any],
@@ -40,12 +80,11 @@ async def async_retry(
             start_time = time.perf_counter()
             result = await func(*args, **kwargs)
             elapsed = time.perf_counter() - start_time
-            credits = result.get("usage", {}).get("credits", 0) if isinstance(result, dict) else 0
+            credits = _credits_of(result)
             return TavilyAPIResponse(data=result, response_time=elapsed, credits=credits)
-        except asyncio.TimeoutError:
+        except asyncio.TimeoutError as e:
             if retry_count < max_retries:
-                wait_time = 2 ** retry_count
-                await asyncio.sleep(wait_time)
+                await asyncio.sleep(_retry_wait_time(retry_count, e))
                 retry_count += 1
             else:
                 return TavilyAPIResponse(
@@ -54,9 +93,8 @@ async def async_retry(
                     credits=0
                 )
         except Exception as e:
-            if retry_count < max_retries:
-                wait_time = 2 ** retry_count
-                await asyncio.sleep(wait_time)
+            if retry_count < max_retries and not isinstance(e, _NON_RETRYABLE_ERRORS):
+                await asyncio.sleep(_retry_wait_time(retry_count, e))
                 retry_count += 1
             else:
                 return TavilyAPIResponse(
@@ -90,12 +128,11 @@ def search_with_retry(
             start_time = time.perf_counter()
             result = client.search(**kwargs)
             elapsed = time.perf_counter() - start_time
-            credits = result.get("usage", {}).get("credits", 0) if isinstance(result, dict) else 0
+            credits = _credits_of(result)
             return TavilyAPIResponse(data=result, response_time=elapsed, credits=credits)
-        except TimeoutError:
+        except TimeoutError as e:
             if retry_count < max_retries:
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
+                time.sleep(_retry_wait_time(retry_count, e))
                 retry_count += 1
             else:
                 return TavilyAPIResponse(
@@ -104,9 +141,8 @@ def search_with_retry(
                     credits=0
                 )
         except Exception as e:
-            if retry_count < max_retries:
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
+            if retry_count < max_retries and not isinstance(e, _NON_RETRYABLE_ERRORS):
+                time.sleep(_retry_wait_time(retry_count, e))
                 retry_count += 1
             else:
                 return TavilyAPIResponse(
@@ -140,12 +176,11 @@ def extract_with_retry(
             start_time = time.perf_counter()
             result = client.extract(**kwargs)
             elapsed = time.perf_counter() - start_time
-            credits = result.get("usage", {}).get("credits", 0) if isinstance(result, dict) else 0
+            credits = _credits_of(result)
             return TavilyAPIResponse(data=result, response_time=elapsed, credits=credits)
-        except TimeoutError:
+        except TimeoutError as e:
             if retry_count < max_retries:
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
+                time.sleep(_retry_wait_time(retry_count, e))
                 retry_count += 1
             else:
                 return TavilyAPIResponse(
@@ -154,9 +189,8 @@ def extract_with_retry(
                     credits=0
                 )
         except Exception as e:
-            if retry_count < max_retries:
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
+            if retry_count < max_retries and not isinstance(e, _NON_RETRYABLE_ERRORS):
+                time.sleep(_retry_wait_time(retry_count, e))
                 retry_count += 1
             else:
                 return TavilyAPIResponse(
@@ -190,12 +224,11 @@ def crawl_with_retry(
             start_time = time.perf_counter()
             result = client.crawl(**kwargs)
             elapsed = time.perf_counter() - start_time
-            credits = result.get("usage", {}).get("credits", 0) if isinstance(result, dict) else 0
+            credits = _credits_of(result)
             return TavilyAPIResponse(data=result, response_time=elapsed, credits=credits)
-        except TimeoutError:
+        except TimeoutError as e:
             if retry_count < max_retries:
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
+                time.sleep(_retry_wait_time(retry_count, e))
                 retry_count += 1
             else:
                 return TavilyAPIResponse(
@@ -204,9 +237,8 @@ def crawl_with_retry(
                     credits=0
                 )
         except Exception as e:
-            if retry_count < max_retries:
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
+            if retry_count < max_retries and not isinstance(e, _NON_RETRYABLE_ERRORS):
+                time.sleep(_retry_wait_time(retry_count, e))
                 retry_count += 1
             else:
                 return TavilyAPIResponse(
@@ -216,6 +248,53 @@ def crawl_with_retry(
                 )
 
 
+@functools.lru_cache(maxsize=16)
+def _get_tavily_client(api_key: str) -> TavilyClient:
+    """Return a TavilyClient for the given key, reusing its pooled HTTP session across calls."""
+    return TavilyClient(api_key=api_key)
+
+
+# Async clients hold an httpx pool bound to the loop that opened its connections, so
+# they are shared per event loop and dropped with it
+_async_tavily_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, AsyncTavilyClient]]" = weakref.WeakKeyDictionary()
+
+
+def _get_async_tavily_client(api_key: str) -> AsyncTavilyClient:
+    """Return an AsyncTavilyClient for the given key, shared by every call on the running loop."""
+    clients = _async_tavily_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(api_key)
+    if client is None:
+        client = clients[api_key] = AsyncTavilyClient(api_key=api_key)
+    return client
+
+
+@functools.lru_cache(maxsize=32)
+def _schema_str(output_schema: Type[BaseModel]) -> str:
+    """Return the JSON schema of a model as it is embedded in prompts, computed once per class."""
+    return str(output_schema.model_json_schema())
+
+
+@functools.lru_cache(maxsize=32)
+def _tavily_schema(output_schema: Type[OutputSchema]) -> dict[str, Any]:
+    """Return the (validated) Tavily research schema for a model, computed once per class.
+
+    The returned dict is shared between calls and must not be mutated.
+    """
+    return output_schema.to_tavily_schema()
+
+
+@functools.lru_cache(maxsize=16)
+def _get_llm(init_kwargs: tuple[tuple[str, Any], ...]) -> Any:
+    """Return a chat model for the given init kwargs, reusing it (and its HTTP client) across calls."""
+    return init_chat_model(**dict(init_kwargs))
+
+
+@functools.lru_cache(maxsize=32)
+def _get_structured_llm(init_kwargs: tuple[tuple[str, Any], ...], output_schema: Type[BaseModel]) -> Any:
+    """Return a cached structured-output runnable that also exposes the raw message for usage."""
+    return _get_llm(init_kwargs).with_structured_output(output_schema, include_raw=True)
+
+
 async def ainvoke_with_fallback(
     model_config: ModelConfig,
     messages: Union[list[dict], str],
@@ -255,16 +334,17 @@ async def ainvoke_with_fallback(
         
         for attempt in range(max_attempts):
             try:
-                # Initialize model (use fallback ModelObject if not primary)
+                # Get cached model (use fallback ModelObject if not primary)
                 model_to_use = model_obj if i > 0 else None
-                llm = init_chat_model(**model_config.to_init_kwargs(model_to_use))
+                init_kwargs = tuple(sorted(model_config.to_init_kwargs(model_to_use).items()))
+                llm = _get_llm(init_kwargs)
                 
                 start_time = time.perf_counter()
                 
                 # Apply structured output if requested
                 if output_schema:
                     # Use include_raw=True to get both parsed result and raw message for usage
-                    llm_structured = llm.with_structured_output(output_schema, include_raw=True)
+                    llm_structured = _get_structured_llm(init_kwargs, output_schema)
                     raw_result = await llm_structured.ainvoke(messages, **invoke_kwargs)
                     elapsed = time.perf_counter() - start_time
                     
@@ -290,7 +370,7 @@ async def ainvoke_with_fallback(
                 last_error = e
                 # If we have more attempts, wait before retry
                 if attempt < max_attempts - 1:
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(_retry_wait_time(attempt, e))
                 # Otherwise, we'll try next model in the cascade (if any)
     
     # All models failed - raise the last error
@@ -299,6 +379,63 @@ async def ainvoke_with_fallback(
     raise RuntimeError("No models available to invoke")
 
 
+async def astream_with_fallback(
+    model_config: ModelConfig,
+    messages: Union[list[dict], str],
+    **invoke_kwargs: Any
+) -> AsyncIterator[Any]:
+    """Stream a model response with fallback cascade support.
+    
+    Streaming counterpart to ainvoke_with_fallback for plain-text responses:
+    yields message chunks as they arrive so callers can start consuming the
+    output after the first token instead of waiting for the full completion.
+    
+    Retry and fallback behavior matches ainvoke_with_fallback, but only
+    applies to failures before the first chunk is yielded. Errors raised
+    mid-stream are propagated, since partial output was already emitted.
+    
+    Args:
+        model_config: ModelConfig with primary model and optional fallback_models
+        messages: Messages to pass to astream (list of dicts or string prompt)
+        **invoke_kwargs: Additional kwargs to pass to astream (e.g., max_tokens)
+        
+    Yields:
+        Message chunks (AIMessageChunk); use chunk.content for the text delta
+        
+    Raises:
+        Exception: If all models fail, raises the last exception encountered
+    """
+    all_models = model_config.get_all_models()
+    has_fallbacks = len(all_models) > 1
+    last_error: Optional[Exception] = None
+    
+    for i, model_obj in enumerate(all_models):
+        max_attempts = 1 if has_fallbacks else 2
+        
+        for attempt in range(max_attempts):
+            started = False
+            try:
+                model_to_use = model_obj if i > 0 else None
+                init_kwargs = tuple(sorted(model_config.to_init_kwargs(model_to_use).items()))
+                llm = _get_llm(init_kwargs)
+                
+                async for chunk in llm.astream(messages, **invoke_kwargs):
+                    started = True
+                    yield chunk
+                return
+            
+            except Exception as e:
+                if started:
+                    raise
+                last_error = e
+                if attempt < max_attempts - 1:
+                    await asyncio.sleep(_retry_wait_time(attempt, e))
+    
+    if last_error:
+        raise last_error
+    raise RuntimeError("No models available to invoke")
+
+
 def _extract_llm_usage(message: Any, response_time: float) -> LLMUsage:
     """Extract token usage from an AIMessage or similar response."""
     usage = LLMUsage()
@@ -332,6 +469,212 @@ def _extract_llm_usage(message: Any, response_time: float) -> LLMUsage:
     return usage
 
 
+# Link texts treated as navigation and dropped by clean_raw_content
+_NAV_TERMS = frozenset({
+    'home', 'menu', 'search', 'sign in', 'sign out', 'subscribe',
+    'newsletter', 'view', 'more', 'skip', 'rss', 'premium', 'forums',
+    'contact', 'about', 'privacy', 'terms', 'cookies', 'advertise',
+    'careers', 'us edition', 'uk edition', 'au edition', 'ca edition',
+})
+
+
+# Navigation and boilerplate patterns removed line-by-line by clean_raw_content,
+# built and compiled once at import rather than on every call
+_SECTION_MARKERS = [
+    r'^#?\s*Recent Posts\s*$',
+    r'^#?\s*Related Articles?\s*$', 
+    r'^#?\s*Related Posts?\s*$',
+    r'^#?\s*Recommended\s*(Articles?|Posts?)?\s*$',
+    r'^#?\s*About\s*(the\s*)?Author\s*$',
+    r'^#?\s*About\s*$',
+    r'^#?\s*Author Bio\s*$',
+    r'^#?\s*Share This\s*(Article|Post)?\s*$',
+    r'^#?\s*Comments?\s*(\(\d+\))?\s*$',
+    r'^#?\s*Leave a (Comment|Reply)\s*$',
+    r'^#?\s*Newsletter\s*(Signup|Subscribe)?\s*$',
+    r'^#?\s*Subscribe\s*$',
+    r'^#?\s*Follow Us\s*$',
+    r'^#?\s*Social Links?\s*$',
+    r'^#?\s*Footer\s*$',
+    r'^#?\s*Site\s*Map\s*$',
+    r'^#?\s*Quick Links?\s*$',
+    r'^\*?Learning Centers and Communities',
+    r'^CRN Answers',
+    r'^#?\s*Popular\s*(Posts?|Articles?)?\s*$',
+    r'^#?\s*Trending\s*(Now)?\s*$',
+    r'^#?\s*More From\s+',
+    r'^#?\s*You May Also Like\s*$',
+    r'^#?\s*Editors?\s*Picks?\s*$',
+]
+
+# Patterns to skip individual lines
+_SKIP_PATTERNS = [
+    r'^\s*[\+\-\*▸►▶•◦‣]\s+\S.{0,25}\s*$',  # Menu items: bullet + short text (handles indentation)
+    r'^\*\s*\*',  # Double asterisk lines
+    r'^Expand All\s*\[\+\]',
+    r'^Collapse All\s*\[\-\]',
+    r'^#?\s*(BROADCAST ANALYSIS|RESEARCH NOTE|ANALYST INSIGHT):',
+    r'^\s*\|\s*\+\s*posts\s*Bio\s*$',  # Author bio markers
+    r'^\s*VP\s*&\s*(Principal\s*)?Analyst',
+    r'^\*.*sponsored by',
+    r'^Advertisement\s*$',
+    r'^Sponsored\s*(Content)?\s*$',
+    r'^Ad\s*$',
+    r'^\s*Share\s*(this)?\s*:?\s*$',
+    r'^\s*Print\s*$',
+    r'^\s*Email\s*$',
+    r'^\s*Copy\s*(Link)?\s*$',
+    r'^\s*Bookmark\s*$',
+    r'^Read\s+More\s*$',
+    r'^Load\s+More\s*$',
+    r'^Show\s+More\s*$',
+    r'^View\s+All\s*$',
+    r'^See\s+All\s*$',
+    r'^Back\s+to\s+Top\s*$',
+    r'^Skip\s+to\s+(Main\s+)?Content\s*$',
+    r'^Jump\s+to\s+',
+    r'^Toggle\s+(Menu|Navigation)\s*$',
+    r'^Open\s+Menu\s*$',
+    r'^Close\s+Menu\s*$',
+    r'^\s*Menu\s*$',
+    r'^\s*Navigation\s*$',
+    r'^\s*Search\s*$',
+    r'^\s*Login\s*$',
+    r'^\s*Sign\s*(In|Up|Out)\s*$',
+    r'^\s*Register\s*$',
+    r'^\s*Log\s*(In|Out)\s*$',
+    r'^©\s*\d{4}',  # Copyright lines
+    r'^All\s+Rights\s+Reserved',
+    r'^Privacy\s+Policy\s*$',
+    r'^Terms\s+(of\s+)?(Service|Use)\s*$',
+    r'^Cookie\s+(Policy|Settings)\s*$',
+    r'^Contact\s+Us\s*$',
+    r'^Accessibility\s*$',
+]
+
+# Social media platform patterns (individual lines)
+_SOCIAL_PATTERNS = [
+    r'^\s*facebook\s*$',
+    r'^\s*twitter\s*$',
+    r'^\s*x\s*$',
+    r'^\s*instagram\s*$',
+    r'^\s*youtube\s*$',
+    r'^\s*linkedin\s*$',
+    r'^\s*reddit\s*$',
+    r'^\s*pinterest\s*$',
+    r'^\s*whatsapp\s*$',
+    r'^\s*telegram\s*$',
+    r'^\s*tiktok\s*$',
+    r'^\s*snapchat\s*$',
+    r'^\s*flipboard\s*$',
+    r'^\s*tumblr\s*$',
+    r'^\s*mastodon\s*$',
+    r'^\s*threads\s*$',
+]
+
+# Common navigation/boilerplate lines
+_BOILERPLATE_PATTERNS = [
+    r'^Open menu\s*$',
+    r'^Close\s*$',
+    r'^Search\s+Search\s+.*$',
+    r'^Sign in\s*$',
+    r'^Sign out\s*$',
+    r'^View Profile\s*$',
+    r'^Subscribe\s*$',
+    r'^Newsletter\s*$',
+    r'^RSS\s*$',
+    r'^Premium\s*$',
+    r'^Forums?\s*$',
+    r'^Advertisement\s*$',
+    r'^Sponsored\s*$',
+    r'^Trending\s*$',
+    r'^Popular\s*$',
+    r'^Related\s*$',
+    r'^Share\s*$',
+    r'^Comments?\s*\(\d*\)\s*$',
+    r'^See all comments.*$',
+    r'^Show more comments\s*$',
+    r'^View All \d+ Comments\s*$',
+    r'^\d+ Comments?\s*$',
+    r'^Comment from the forums\s*$',
+    r'^Reply\s*$',
+    r'^Read more\s*$',
+    r'^Load more\s*$',
+    r'^Show more\s*$',
+    r'^View\s+\w+\s*$',  # "View CPUs", "View News", etc.
+    r'^Skip to .*content.*$',
+    r'^Jump to.*$',
+    r'^Back to top\s*$',
+    r'^Table of contents\s*$',
+    r'^On this page\s*$',
+    r'^In this article\s*$',
+    r'^TOPICS?\s*$',
+    r'^TAGS?\s*$',
+    r'^Latest Videos?.*$',
+    r'^Latest in .*$',
+    r'^Latest News\s*$',
+    r'^Don\'t miss.*$',
+    r'^You may (?:also )?like\s*$',
+    r'^Recommended\s*$',
+    r'^More from.*$',
+    r'^See also\s*$',
+    r'^.*Edition.*flag of.*$',
+    r'^Follow.*on Google News.*$',
+    r'^Get .* Newsletter\s*$',
+    r'^Stay On the Cutting Edge.*$',
+    r'^By submitting your information.*$',
+    r'^Contact me with news.*$',
+    r'^Receive email from us.*$',
+    r'^Terms and conditions\s*$',
+    r'^Privacy policy\s*$',
+    r'^Cookies? policy\s*$',
+    r'^Accessibility Statement\s*$',
+    r'^Advertise with us\s*$',
+    r'^About us\s*$',
+    r'^Careers\s*$',
+    r'^Do not sell.*personal information.*$',
+    r'^©.*Full.*Floor.*$',  # Copyright with address
+    r'^©\s*\d{4}.*$',
+    r'^All rights reserved.*$',
+    r'^When you purchase through links.*$',
+    r'^We may earn.*affiliate.*$',
+    r'^Here\'s how it works.*$',
+    r'^Keyboard Shortcuts.*$',
+    r'^Press shift question mark.*$',
+    r'^Shortcuts Open/Close.*$',
+    r'^\s*Play/Pause\s+SPACE\s*$',
+    r'^\s*Increase Volume.*$',
+    r'^\s*Decrease Volume.*$',
+    r'^\s*Seek Forward.*$',
+    r'^\s*Seek Backward.*$',
+    r'^\s*Captions On/Off.*$',
+    r'^\s*Fullscreen.*$',
+    r'^\s*Mute/Unmute.*$',
+    r'^\s*Next Up\s*$',
+    r'^\s*More Videos\s*$',
+    r'^\s*PLAY SOUND\s*$',
+    r'^\s*Live\s*$',
+    r'^\s*\d{2}:\d{2}\s*$',  # Timestamps like 01:35
+    r'^Add as a preferred source.*$',
+    r'^.*part of Future.*Inc.*$',
+    r'^Visit our corporate site.*$',
+    r'^Contact Future\'s experts.*$',
+]
+
+_LINE_NOISE_RES = tuple(
+    re.compile(pattern, re.MULTILINE | re.IGNORECASE)
+    for pattern in _SECTION_MARKERS + _SKIP_PATTERNS + _SOCIAL_PATTERNS + _BOILERPLATE_PATTERNS
+)
+
+
+# Single-pass replacements shared by clean_raw_content and clean_formatted_output.
+# Each one merges rewrites of disjoint characters, so a single scan gives the same
+# result as running the individual substitutions back to back.
+_SEPARATOR_RUN_RE = re.compile(r'([-=_*#])\1{2,}')
+_FORMATTED_SEPARATOR_RUN_RE = re.compile(r'([-=_])\1{2,}')
+_ELLIPSIS_MARKER_RE = re.compile(r'\s*\[(?:\.\.\.|…)\]\s*')
+
+
 def clean_raw_content(content: str) -> str:
     """
     Clean raw web content by removing common web noise patterns including
@@ -342,219 +685,42 @@ def clean_raw_content(content: str) -> str:
     
     cleaned = content
     
+    # Passes that need a literal marker (e.g. '](', '://', '|', '...') are
+    # skipped when the marker is absent from the current text, so snippets and
+    # already-clean text only pay for the line-level patterns below.
+    
     # === MARKDOWN CLEANUP ===
     
-    # Remove markdown image references: ![alt text](url) or ![Image N: description](url)
-    cleaned = re.sub(r'!\[(?:Image\s*\d*:?\s*)?[^\]]*\]\([^)]+\)', '', cleaned)
-    
-    # Convert markdown links to just text: [text](url) -> text
-    # But remove navigation-style links entirely (short text that's just menu items)
-    def replace_link(match):
-        text = match.group(1)
-        # Remove if it looks like navigation (very short or common nav terms)
-        nav_terms = ['home', 'menu', 'search', 'sign in', 'sign out', 'subscribe', 
-                     'newsletter', 'view', 'more', 'skip', 'rss', 'premium', 'forums',
-                     'contact', 'about', 'privacy', 'terms', 'cookies', 'advertise',
-                     'careers', 'us edition', 'uk edition', 'au edition', 'ca edition']
-        if len(text) < 4 or text.lower().strip() in nav_terms:
-            return ''
-        return text
-    cleaned = re.sub(r'\[([^\]]*)\]\([^)]+\)', replace_link, cleaned)
+    if '](' in cleaned:
+        # Remove markdown image references: ![alt text](url) or ![Image N: description](url)
+        cleaned = re.sub(r'!\[(?:Image\s*\d*:?\s*)?[^\]]*\]\([^)]+\)', '', cleaned)
+        
+        # Convert markdown links to just text: [text](url) -> text
+        # But remove navigation-style links entirely (short text that's just menu items)
+        def replace_link(match):
+            text = match.group(1)
+            # Remove if it looks like navigation (very short or common nav terms)
+            if len(text) < 4 or text.lower().strip() in _NAV_TERMS:
+                return ''
+            return text
+        cleaned = re.sub(r'\[([^\]]*)\]\([^)]+\)', replace_link, cleaned)
     
     # Remove bare URLs (http/https links not in markdown format)
-    cleaned = re.sub(r'https?://[^\s\)\]]+', '', cleaned)
+    if '://' in cleaned:
+        cleaned = re.sub(r'https?://[^\s\)\]]+', '', cleaned)
     
     # Remove HTML comments
-    cleaned = re.sub(r'<!--.*?-->', '', cleaned, flags=re.DOTALL)
+    if '<!--' in cleaned:
+        cleaned = re.sub(r'<!--.*?-->', '', cleaned, flags=re.DOTALL)
     
     # Remove checkbox markers
-    cleaned = re.sub(r'- \[[ x]\]\s*', '', cleaned)
+    if '- [' in cleaned:
+        cleaned = re.sub(r'- \[[ x]\]\s*', '', cleaned)
     
     # === NAVIGATION AND BOILERPLATE PATTERNS ===
     
-    section_markers = [
-        r'^#?\s*Recent Posts\s*$',
-        r'^#?\s*Related Articles?\s*$', 
-        r'^#?\s*Related Posts?\s*$',
-        r'^#?\s*Recommended\s*(Articles?|Posts?)?\s*$',
-        r'^#?\s*About\s*(the\s*)?Author\s*$',
-        r'^#?\s*About\s*$',
-        r'^#?\s*Author Bio\s*$',
-        r'^#?\s*Share This\s*(Article|Post)?\s*$',
-        r'^#?\s*Comments?\s*(\(\d+\))?\s*$',
-        r'^#?\s*Leave a (Comment|Reply)\s*$',
-        r'^#?\s*Newsletter\s*(Signup|Subscribe)?\s*$',
-        r'^#?\s*Subscribe\s*$',
-        r'^#?\s*Follow Us\s*$',
-        r'^#?\s*Social Links?\s*$',
-        r'^#?\s*Footer\s*$',
-        r'^#?\s*Site\s*Map\s*$',
-        r'^#?\s*Quick Links?\s*$',
-        r'^\*?Learning Centers and Communities',
-        r'^CRN Answers',
-        r'^#?\s*Popular\s*(Posts?|Articles?)?\s*$',
-        r'^#?\s*Trending\s*(Now)?\s*$',
-        r'^#?\s*More From\s+',
-        r'^#?\s*You May Also Like\s*$',
-        r'^#?\s*Editors?\s*Picks?\s*$',
-    ]
-    
-    # Patterns to skip individual lines
-    skip_patterns = [
-        r'^\s*[\+\-\*▸►▶•◦‣]\s+\S.{0,25}\s*$',  # Menu items: bullet + short text (handles indentation)
-        r'^\*\s*\*',  # Double asterisk lines
-        r'^Expand All\s*\[\+\]',
-        r'^Collapse All\s*\[\-\]',
-        r'^#?\s*(BROADCAST ANALYSIS|RESEARCH NOTE|ANALYST INSIGHT):',
-        r'^\s*\|\s*\+\s*posts\s*Bio\s*$',  # Author bio markers
-        r'^\s*VP\s*&\s*(Principal\s*)?Analyst',
-        r'^\*.*sponsored by',
-        r'^Advertisement\s*$',
-        r'^Sponsored\s*(Content)?\s*$',
-        r'^Ad\s*$',
-        r'^\s*Share\s*(this)?\s*:?\s*$',
-        r'^\s*Print\s*$',
-        r'^\s*Email\s*$',
-        r'^\s*Copy\s*(Link)?\s*$',
-        r'^\s*Bookmark\s*$',
-        r'^Read\s+More\s*$',
-        r'^Load\s+More\s*$',
-        r'^Show\s+More\s*$',
-        r'^View\s+All\s*$',
-        r'^See\s+All\s*$',
-        r'^Back\s+to\s+Top\s*$',
-        r'^Skip\s+to\s+(Main\s+)?Content\s*$',
-        r'^Jump\s+to\s+',
-        r'^Toggle\s+(Menu|Navigation)\s*$',
-        r'^Open\s+Menu\s*$',
-        r'^Close\s+Menu\s*$',
-        r'^\s*Menu\s*$',
-        r'^\s*Navigation\s*$',
-        r'^\s*Search\s*$',
-        r'^\s*Login\s*$',
-        r'^\s*Sign\s*(In|Up|Out)\s*$',
-        r'^\s*Register\s*$',
-        r'^\s*Log\s*(In|Out)\s*$',
-        r'^©\s*\d{4}',  # Copyright lines
-        r'^All\s+Rights\s+Reserved',
-        r'^Privacy\s+Policy\s*$',
-        r'^Terms\s+(of\s+)?(Service|Use)\s*$',
-        r'^Cookie\s+(Policy|Settings)\s*$',
-        r'^Contact\s+Us\s*$',
-        r'^Accessibility\s*$',
-    ]
-    
-    # Social media platform patterns (individual lines)
-    social_platforms = [
-        r'^\s*facebook\s*$',
-        r'^\s*twitter\s*$',
-        r'^\s*x\s*$',
-        r'^\s*instagram\s*$',
-        r'^\s*youtube\s*$',
-        r'^\s*linkedin\s*$',
-        r'^\s*reddit\s*$',
-        r'^\s*pinterest\s*$',
-        r'^\s*whatsapp\s*$',
-        r'^\s*telegram\s*$',
-        r'^\s*tiktok\s*$',
-        r'^\s*snapchat\s*$',
-        r'^\s*flipboard\s*$',
-        r'^\s*tumblr\s*$',
-        r'^\s*mastodon\s*$',
-        r'^\s*threads\s*$',
-    ]
-    # Remove common navigation/boilerplate lines
-    boilerplate_patterns = [
-        r'^Open menu\s*$',
-        r'^Close\s*$',
-        r'^Search\s+Search\s+.*$',
-        r'^Sign in\s*$',
-        r'^Sign out\s*$',
-        r'^View Profile\s*$',
-        r'^Subscribe\s*$',
-        r'^Newsletter\s*$',
-        r'^RSS\s*$',
-        r'^Premium\s*$',
-        r'^Forums?\s*$',
-        r'^Advertisement\s*$',
-        r'^Sponsored\s*$',
-        r'^Trending\s*$',
-        r'^Popular\s*$',
-        r'^Related\s*$',
-        r'^Share\s*$',
-        r'^Comments?\s*\(\d*\)\s*$',
-        r'^See all comments.*$',
-        r'^Show more comments\s*$',
-        r'^View All \d+ Comments\s*$',
-        r'^\d+ Comments?\s*$',
-        r'^Comment from the forums\s*$',
-        r'^Reply\s*$',
-        r'^Read more\s*$',
-        r'^Load more\s*$',
-        r'^Show more\s*$',
-        r'^View\s+\w+\s*$',  # "View CPUs", "View News", etc.
-        r'^Skip to .*content.*$',
-        r'^Jump to.*$',
-        r'^Back to top\s*$',
-        r'^Table of contents\s*$',
-        r'^On this page\s*$',
-        r'^In this article\s*$',
-        r'^TOPICS?\s*$',
-        r'^TAGS?\s*$',
-        r'^Latest Videos?.*$',
-        r'^Latest in .*$',
-        r'^Latest News\s*$',
-        r'^Don\'t miss.*$',
-        r'^You may (?:also )?like\s*$',
-        r'^Recommended\s*$',
-        r'^More from.*$',
-        r'^See also\s*$',
-        r'^.*Edition.*flag of.*$',
-        r'^Follow.*on Google News.*$',
-        r'^Get .* Newsletter\s*$',
-        r'^Stay On the Cutting Edge.*$',
-        r'^By submitting your information.*$',
-        r'^Contact me with news.*$',
-        r'^Receive email from us.*$',
-        r'^Terms and conditions\s*$',
-        r'^Privacy policy\s*$',
-        r'^Cookies? policy\s*$',
-        r'^Accessibility Statement\s*$',
-        r'^Advertise with us\s*$',
-        r'^About us\s*$',
-        r'^Careers\s*$',
-        r'^Do not sell.*personal information.*$',
-        r'^©.*Full.*Floor.*$',  # Copyright with address
-        r'^©\s*\d{4}.*$',
-        r'^All rights reserved.*$',
-        r'^When you purchase through links.*$',
-        r'^We may earn.*affiliate.*$',
-        r'^Here\'s how it works.*$',
-        r'^Keyboard Shortcuts.*$',
-        r'^Press shift question mark.*$',
-        r'^Shortcuts Open/Close.*$',
-        r'^\s*Play/Pause\s+SPACE\s*$',
-        r'^\s*Increase Volume.*$',
-        r'^\s*Decrease Volume.*$',
-        r'^\s*Seek Forward.*$',
-        r'^\s*Seek Backward.*$',
-        r'^\s*Captions On/Off.*$',
-        r'^\s*Fullscreen.*$',
-        r'^\s*Mute/Unmute.*$',
-        r'^\s*Next Up\s*$',
-        r'^\s*More Videos\s*$',
-        r'^\s*PLAY SOUND\s*$',
-        r'^\s*Live\s*$',
-        r'^\s*\d{2}:\d{2}\s*$',  # Timestamps like 01:35
-        r'^Add as a preferred source.*$',
-        r'^.*part of Future.*Inc.*$',
-        r'^Visit our corporate site.*$',
-        r'^Contact Future\'s experts.*$',
-    ]
-    all_patterns = section_markers + skip_patterns + social_platforms + boilerplate_patterns
-    
-    for pattern in all_patterns:
-        cleaned = re.sub(pattern, '', cleaned, flags=re.MULTILINE | re.IGNORECASE)
+    for pattern in _LINE_NOISE_RES:
+        cleaned = pattern.sub('', cleaned)
         
     # Remove empty list items (just bullets with no content)
     cleaned = re.sub(r'^\s*[\*\-\+]\s*$', '', cleaned, flags=re.MULTILINE)
@@ -567,14 +733,8 @@ def clean_raw_content(content: str) -> str:
     
     # === REPEATED SEPARATOR CLEANUP ===
     
-    # Collapse multiple dashes, equals, underscores
-    cleaned = re.sub(r'-{3,}', '--', cleaned)
-    cleaned = re.sub(r'={3,}', '==', cleaned)
-    cleaned = re.sub(r'_{3,}', '__', cleaned)
-    cleaned = re.sub(r'\*{3,}', '**', cleaned)
-    
-    # Collapse multiple hash marks
-    cleaned = re.sub(r'#{3,}', '##', cleaned)
+    # Collapse runs of dashes, equals, underscores, asterisks and hash marks to two
+    cleaned = _SEPARATOR_RUN_RE.sub(r'\1\1', cleaned)
     
     # === WHITESPACE CLEANUP ===
     
@@ -582,17 +742,20 @@ def clean_raw_content(content: str) -> str:
     cleaned = re.sub(r'^\s*[\|\-\*\+\>\<\#\=\_]+\s*$', '', cleaned, flags=re.MULTILINE)
     
     # Remove empty table patterns
-    cleaned = re.sub(r'\|\s*\|', '|', cleaned)
-    cleaned = re.sub(r'\n\s*\|\s*\n', '\n', cleaned)
+    if '|' in cleaned:
+        cleaned = re.sub(r'\|\s*\|', '|', cleaned)
+        cleaned = re.sub(r'\n\s*\|\s*\n', '\n', cleaned)
     
     # Remove standalone ellipsis markers
-    cleaned = re.sub(r'\s*\[\.\.\.\]\s*', ' ', cleaned)
-    cleaned = re.sub(r'\s*\[…\]\s*', ' ', cleaned)
-    cleaned = re.sub(r'\s*\.\.\.\s*', ' ', cleaned)
+    if '[' in cleaned:
+        cleaned = _ELLIPSIS_MARKER_RE.sub(' ', cleaned)
+    if '...' in cleaned:
+        cleaned = re.sub(r'\s*\.\.\.\s*', ' ', cleaned)
     
     # Remove excessive whitespace
     cleaned = re.sub(r' {2,}', ' ', cleaned)
-    cleaned = re.sub(r'\t+', ' ', cleaned)
+    if '\t' in cleaned:
+        cleaned = re.sub(r'\t+', ' ', cleaned)
     
     # Collapse multiple newlines (more than 2) to 2
     cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
@@ -611,16 +774,14 @@ def clean_raw_content(content: str) -> str:
 
 
 def clean_formatted_output(formatted_output: str) -> str:
-    cleaned = re.sub(r'-{3,}', '--', formatted_output)
-    cleaned = re.sub(r'={3,}', '==', cleaned)
-    cleaned = re.sub(r'_{3,}', '__', cleaned)
+    # Collapse runs of dashes, equals, underscores to two
+    cleaned = _FORMATTED_SEPARATOR_RUN_RE.sub(r'\1\1', formatted_output)
             
     # Replace multiple newlines with 1
     cleaned = re.sub(r'\n{2,}', '\n', cleaned)
             
     # Remove standalone [...] ellipsis markers (but keep content)
-    cleaned = re.sub(r'\s*\[\.\.\.\]\s*', ' ', cleaned)
-    cleaned = re.sub(r'\s*\[…\]\s*', ' ', cleaned)
+    cleaned = _ELLIPSIS_MARKER_RE.sub(' ', cleaned)
             
     # Remove excessive whitespace
     cleaned = re.sub(r' {2,}', ' ', cleaned)
@@ -633,7 +794,10 @@ def clean_formatted_output(formatted_output: str) -> str:
     cleaned = re.sub(r'\n\s*\|\s*\n', '\n', cleaned)  # Empty table rows
     return cleaned
 
+@functools.lru_cache(maxsize=32)
 def get_tiktoken_encoding(model: str):
+    # Cached per model name: encoding_for_model raises KeyError for most
+    # non-OpenAI models, and count_tokens is called once per source.
     try:
         return tiktoken.encoding_for_model(model)
     except KeyError:
@@ -643,25 +807,57 @@ def count_tokens(text: str, model: str = "cl100k_base") -> int:
     encoding = get_tiktoken_encoding(model)
     return len(encoding.encode(text))
 
-async def summarize_long_content(model_config: ModelConfig, content: str, query: str, token_limit: int = 40000) -> str:
+_SOURCE_HEADER_RE = re.compile(r'--- SOURCE \d+: (.*?) ---\nURL: (.*?)\n')
+_IMAGE_HEADER_RE = re.compile(r'--- IMAGE \d+')
+
+
+def _parse_sources(content: str) -> list[tuple[str, str, str]]:
+    """Split format_web_results output into (title, url, body) tuples.
+    
+    Bodies are sliced between consecutive source headers (stopping early at
+    an image section) rather than captured by a lazy lookahead regex.
+    """
+    headers = list(_SOURCE_HEADER_RE.finditer(content))
+    sources = []
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+        if image := _IMAGE_HEADER_RE.search(content, header.end(), end):
+            end = image.start()
+        sources.append((header.group(1), header.group(2), content[header.end():end]))
+    return sources
+
+async def summarize_long_content(
+    model_config: ModelConfig,
+    content: str,
+    query: str,
+    token_limit: int = 40000,
+    max_concurrency: int = 5,
+) -> str:
     """Group sources into minimal chunks, summarize each with capped output tokens.
     
+    Chunks are summarized concurrently, at most max_concurrency at a time.
+    
     Args:
         model_config: ModelConfig for the model to use (with optional fallbacks)
         content: The content to summarize
         query: The original query for context
         token_limit: Maximum tokens for the combined output
+        max_concurrency: Maximum number of chunk summaries in flight at once
     """
     # Parse sources with metadata
-    source_pattern = r'--- SOURCE \d+: (.*?) ---\nURL: (.*?)\n(.*?)(?=--- SOURCE \d+:|--- IMAGE \d+|$)'
-    matches = re.findall(source_pattern, content, re.DOTALL)
+    matches = _parse_sources(content)
     
     if not matches:
         return content[:token_limit * 3]
     
-    # Calculate tokens per source
-    model_name = model_config.model.model
-    sources = [(title.strip(), url.strip(), body.strip(), count_tokens(body, model_name)) for title, url, body in matches]
+    # Calculate tokens per source (encode_batch tokenizes all bodies in parallel)
+    encoding = get_tiktoken_encoding(model_config.model.model)
+    bodies = [body.strip() for _, _, body in matches]
+    token_counts = map(len, encoding.encode_batch(bodies, num_threads=os.cpu_count() or 4))
+    sources = [
+        (title.strip(), url.strip(), body, tokens)
+        for (title, url, _), body, tokens in zip(matches, bodies, token_counts)
+    ]
     total_tokens = sum(s[3] for s in sources)
     
     # Determine number of chunks based on model context limits (~40k input per chunk)
@@ -686,22 +882,28 @@ async def summarize_long_content(model_config: ModelConfig, content: str, query:
     num_chunks = len(chunks)
     max_tokens_per_summary = token_limit // num_chunks
     
-    # Summarize each chunk with capped output
-    summaries = []
-    for bodies, source_list in chunks:
+    # Summarize chunks in parallel with capped output
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def summarize_chunk(bodies: list[str], source_list: list[tuple[str, str]]) -> str:
         chunk_content = "\n\n---\n\n".join(bodies)
         prompt = f"""Summarize these search results for the query: {query}
 Preserve all key facts. Be concise but thorough.
 
 {chunk_content}"""
-        summary = await ainvoke_with_fallback(
-            model_config,
-            [{"role": "user", "content": prompt}],
-            max_tokens=int(max_tokens_per_summary)
-        )
+        async with semaphore:
+            summary = await ainvoke_with_fallback(
+                model_config,
+                [{"role": "user", "content": prompt}],
+                max_tokens=int(max_tokens_per_summary)
+            )
         # Append actual sources
         sources_text = "\n".join(f"- [{t}]({u})" for t, u in source_list)
-        summaries.append(f"{summary.content}\n\nSources:\n{sources_text}")
+        return f"{summary.content}\n\nSources:\n{sources_text}"
+    
+    summaries = await asyncio.gather(
+        *(summarize_chunk(bodies, source_list) for bodies, source_list in chunks)
+    )
     
     return "\n\n---\n\n".join(summaries)
 
@@ -710,6 +912,28 @@ class SubqueriesOutput(BaseModel):
     subqueries: list[str]
 
 
+_QUERY_TOKEN_RE = re.compile(r'\w+')
+
+
+def _dedup_subqueries(queries: Sequence[str], similarity: float = 0.85) -> list[str]:
+    """Drop repeated and near-duplicate queries, keeping the first occurrence.
+    
+    Queries are compared case-insensitively by their word sets; a query whose
+    Jaccard similarity with an already kept query exceeds ``similarity`` is dropped.
+    """
+    kept: list[str] = []
+    kept_tokens: list[frozenset[str]] = []
+    for query in queries:
+        tokens = frozenset(_QUERY_TOKEN_RE.findall(query.lower()))
+        if not tokens:
+            continue
+        if any(len(tokens & other) / len(tokens | other) > similarity for other in kept_tokens):
+            continue
+        kept.append(" ".join(query.split()))
+        kept_tokens.append(tokens)
+    return kept
+
+
 async def generate_subqueries(
     query: str,
     model_config: ModelConfig,
@@ -735,7 +959,7 @@ Do not include dates or years in the queries unless explicitly specified in the
     if context:
         messages.append({"role": "user", "content": f"Here is the context that you can use to generate the subqueries: {context}\n We want to generate subqueries that fill the gaps in the context for the query: {query}"})
     if output_schema:
-        messages.append({"role": "user", "content": f"Your research goal is to fill out this schema: {output_schema.model_json_schema()}"})
+        messages.append({"role": "user", "content": f"Your research goal is to fill out this schema: {_schema_str(output_schema)}"})
     
     if return_usage:
         response = await ainvoke_with_fallback(model_config, messages, output_schema=SubqueriesOutput, return_usage=True)
@@ -805,11 +1029,12 @@ async def synthesize_results(
             return cast(str, result.content)
 
 def format_web_results(web_results: Sequence[SearchResult]) -> str:
-    formatted_output = "Search results: \n\n"
+    parts = ["Search results: \n\n"]
     for i, item in enumerate(web_results):
-        formatted_output += f"\n\n--- SOURCE {i+1}: {item['title']} ---\n"
-        formatted_output += f"URL: {item['url']}\n\n"
-        formatted_output += f"SUMMARY OF WEBPAGE:\n{item['content']}\n\n"
-        formatted_output += "\n"
+        parts.append(
+            f"\n\n--- SOURCE {i+1}: {item['title']} ---\n"
+            f"URL: {item['url']}\n\n"
+            f"SUMMARY OF WEBPAGE:\n{item['content']}\n\n\n"
+        )
     
-    return formatted_output
\ No newline at end of file
+    return "".join(parts)
\ No newline at end of file